@@ -8,31 +8,228 @@ Approach:
 - When we reach the required combination size (m), we print the current combination
 Time Complexity: O(C(n, m) * m) where C(n, m) is the binomial coefficient
 Space Complexity: O(m) for the recursion stack and the way array
+
+Streaming engine (used by main):
+- One print per combination dominates the runtime for large C(n, m), so the iterative
+  engine walks combinations with a next-combination step and writes them in large byte chunks
+- For a fixed prefix the last element runs from its current value up to n, so the prefix
+  string is built once and every line of the run is a single concatenation; prefix strings
+  are cached per position, so an advance only re-renders the positions that changed
+- rank / unrank map combinations to their lexicographic index and back, which lets the
+  C(n, m) space be split into index ranges that a process pool generates independently;
+  the shards are written back in index order, so the output is identical to the serial one
 """
 
+import os
+import sys
+import time
+from math import comb as binom
+
+# Number of lines collected before a chunk is encoded and handed to the writer
+CHUNK_LINES = 1 << 16
+# Number of combinations generated by one worker task in parallel mode
+SHARD_SIZE = 1 << 20
 
-def dfs(u, start):
+
+def dfs(n, m, out, u=0, start=1, way=None):
     """
-    u: Current position in the combination we're building
-    start: The smallest number we can choose for the current position
+    Recursive reference enumeration (one print per combination)
+
+    Args:
+        n: Upper bound of the numbers
+        m: Combination size
+        out: Text stream receiving the lines
+        u: Current position in the combination we're building
+        start: The smallest number we can choose for the current position
+        way: Combination being built (allocated on the first call)
     """
+    if way is None:
+        way = [0] * m
     # Base case: when we've filled all m positions in the combination
     if u == m:
         # Print the current combination as space-separated numbers
-        print(' '.join(map(str, way[:m])))
+        print(' '.join(map(str, way[:m])), file=out)
         return
 
     # Try all possible numbers from 'start' to n
     for i in range(start, n + 1):
         way[u] = i  # Choose number i for the current position
         # Recursively build the next position with numbers greater than i
-        dfs(u + 1, i + 1)
+        dfs(n, m, out, u + 1, i + 1, way)
 
 
-if __name__ == "__main__":
-    # Read input: n (range 1 to n) and m (combination size)
+def rank(comb, n):
+    """
+    Lexicographic index of a combination among all size-m combinations of 1..n
+
+    Args:
+        comb: Increasing list of m numbers from 1..n
+        n: Upper bound of the numbers
+
+    Returns:
+        The 0-indexed position of comb in the order produced by dfs
+    """
+    m = len(comb)
+    r = 0
+    prev = 0
+    for pos, value in enumerate(comb):
+        # Every combination that puts a smaller number at this position comes first
+        for x in range(prev + 1, value):
+            r += binom(n - x, m - pos - 1)
+        prev = value
+    return r
+
+
+def unrank(i, n, m):
+    """
+    Inverse of rank: build the i-th (0-indexed) combination of size m from 1..n
+
+    Args:
+        i: Lexicographic index, 0 <= i < C(n, m)
+        n: Upper bound of the numbers
+        m: Combination size
+
+    Returns:
+        The combination as an increasing list of m numbers
+    """
+    if i < 0 or i >= binom(n, m):
+        raise ValueError("index must be between 0 and C(n, m) - 1")
+
+    result = []
+    x = 1
+    for pos in range(m):
+        # Skip whole blocks of combinations that start with x at this position
+        while True:
+            block = binom(n - x, m - pos - 1)
+            if i < block:
+                break
+            i -= block
+            x += 1
+        result.append(x)
+        x += 1
+    return result
+
+
+def iter_chunks(n, m, start=0, stop=None, chunk_lines=CHUNK_LINES):
+    """
+    Generate the combinations with rank in [start, stop) as encoded output chunks
+
+    Args:
+        n: Upper bound of the numbers
+        m: Combination size
+        start: Rank of the first combination to emit
+        stop: Rank one past the last combination to emit (default: all of them)
+        chunk_lines: Approximate number of lines per yielded chunk
+
+    Yields:
+        bytes objects holding newline-terminated lines, in lexicographic order
+    """
+    total = binom(n, m)
+    stop = total if stop is None else min(stop, total)
+    if start >= stop:
+        return
+    if m == 0:
+        # The only combination of size 0 is the empty one
+        yield b"\n"
+        return
+
+    strs = [str(v) for v in range(n + 1)]
+    c = unrank(start, n, m)
+    last = m - 1
+    remaining = stop - start
+    lines = []
+    # prefixes[k] is the rendered text of c[:k]; only the changed tail is rebuilt
+    prefixes = [''] * m
+    for k in range(1, m):
+        prefixes[k] = prefixes[k - 1] + strs[c[k - 1]] + ' '
+
+    while True:
+        # The last position runs from c[last] up to n under a fixed prefix
+        hi = min(n, c[last] + remaining - 1)
+        lines.extend(map(prefixes[last].__add__, strs[c[last]:hi + 1]))
+        remaining -= hi - c[last] + 1
+
+        if remaining == 0 or len(lines) >= chunk_lines:
+            lines.append('')
+            yield '\n'.join(lines).encode()
+            lines = []
+            if remaining == 0:
+                return
+
+        # Advance the prefix: find the rightmost position that can still grow
+        p = last - 1
+        while c[p] == n - m + 1 + p:
+            p -= 1
+        c[p] += 1
+        for q in range(p + 1, m):
+            c[q] = c[q - 1] + 1
+            prefixes[q] = prefixes[q - 1] + strs[c[q - 1]] + ' '
+
+
+def _shard(args):
+    """Worker task: render one rank range into a single bytes block."""
+    n, m, start, stop = args
+    return b''.join(iter_chunks(n, m, start, stop))
+
+
+def write_combinations(n, m, out, workers=1, shard_size=SHARD_SIZE):
+    """
+    Write all size-m combinations of 1..n to a binary stream
+
+    Args:
+        n: Upper bound of the numbers
+        m: Combination size
+        out: Binary writable stream (e.g. sys.stdout.buffer)
+        workers: Number of processes; 1 generates everything in this process
+        shard_size: Number of combinations per worker task
+
+    Returns:
+        The number of combinations written
+    """
+    total = binom(n, m)
+    if workers <= 1 or total <= shard_size:
+        for chunk in iter_chunks(n, m):
+            out.write(chunk)
+        return total
+
+    from multiprocessing import Pool
+
+    shards = [(n, m, lo, min(lo + shard_size, total)) for lo in range(0, total, shard_size)]
+    with Pool(workers) as pool:
+        # imap keeps the shards in rank order while workers run ahead
+        for block in pool.imap(_shard, shards):
+            out.write(block)
+    return total
+
+
+def benchmark():
+    """
+    Report throughput (combinations/sec) for the serial and parallel engines
+    """
+    cases = [(20, 10), (24, 12), (26, 13)]
+    cores = os.cpu_count() or 1
+    with open(os.devnull, 'wb') as sink:
+        for n, m in cases:
+            for workers in sorted({1, cores}):
+                t0 = time.perf_counter()
+                count = write_combinations(n, m, sink, workers)
+                elapsed = time.perf_counter() - t0
+                print(f"C({n},{m}) = {count}  workers={workers}  "
+                      f"{elapsed:.2f}s  {count / elapsed:,.0f} comb/s")
+
+
+def main():
+    """
+    Read n and m and stream every combination; an optional argument sets the worker count
+    """
     n, m = map(int, input().split())
-    # Initialize array to store the current combination being built
-    way = [0] * m  # Only need m positions for the combination
-    # Start DFS from position 0 with starting number 1
-    dfs(0, 1)
\ No newline at end of file
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    write_combinations(n, m, sys.stdout.buffer, workers)
+    sys.stdout.buffer.flush()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["bench"]:
+        benchmark()
+    else:
+        main()
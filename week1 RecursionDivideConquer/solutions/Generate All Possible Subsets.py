@@ -15,38 +15,250 @@ Key observations:
 
 Example for n=3:
   Output will be: [1], [1,2], [1,2,3], [1,3], [2], [2,3], [3]
+
+Block engine (used by main):
+- Index i in 0..2^n-1 maps to the i-th subset of the output (0 is the empty subset):
+  the subtree under a subset whose largest element is x holds 2^(n-x) subsets, so the
+  index is decoded by walking x = 1..n and either entering or skipping each subtree
+- The last k elements form a "tail" whose 2^k - 1 non-empty subsets are rendered once as a
+  template; every subset of the first n-k elements (the "head") is followed, after its own
+  subtree, by that template with the head as a prefix, so a whole block of 2^k - 1 lines is
+  produced by a single str.join and the interpreter only touches 2^(n-k) head subsets
+- Gray-code order (i ^ (i >> 1)) changes exactly one element per step; there the tail
+  sequence of each block is the tail Gray sequence forwards or backwards, so the same
+  template trick applies
+- subset_bits decodes a batch of indices into a NumPy bit-matrix in n vectorized steps,
+  which gives random access for sharding and cross-checking
 """
 
+import sys
+
+# Number of trailing elements rendered as a reusable template
+TAIL = 12
+# Approximate number of lines collected before a chunk is encoded
+CHUNK_LINES = 1 << 16
+
 
-def dfs(u, path):
+def dfs(n, out, u=0, path=None):
     """
-    Recursive DFS function to generate subsets
+    Recursive DFS function to generate subsets (reference for the block engine below)
 
     Args:
+        n: Size of the ground set {1..n}
+        out: Text stream receiving the lines (the empty subset prints nothing)
         u: The last number added to the path (used to ensure increasing order)
-        path: Current subset being built
+        path: Current subset being built (allocated on the first call)
     """
+    if path is None:
+        path = []
     # Print the current path immediately to maintain lexicographical order
     # This ensures we print subsets as we build them, in the correct sequence
     if path:
-        print(' '.join(map(str, path)))
+        print(' '.join(map(str, path)), file=out)
 
     # Iterate through all numbers greater than the last number added
     # This ensures the subset remains in increasing order and avoids duplicates
     for i in range(u + 1, n + 1):
         path.append(i)  # Choose number i
-        dfs(i, path)  # Recursively build larger subsets
+        dfs(n, out, i, path)  # Recursively build larger subsets
         path.pop()  # Backtrack: remove i to try other possibilities
 
 
-# Read input: the maximum number n
-n = int(input())
+def subset_at(i, n):
+    """
+    Decode an output index into its subset
+
+    Args:
+        i: Index in 0..2^n-1 (0 is the empty subset printed first)
+        n: Size of the ground set {1..n}
+
+    Returns:
+        The subset as an increasing list
+    """
+    if i < 0 or i >= 1 << n:
+        raise ValueError("index must be between 0 and 2^n - 1")
+
+    result = []
+    for x in range(1, n + 1):
+        if i == 0:
+            break
+        size = 1 << (n - x)  # Subsets in the subtree under x
+        if i - 1 < size:
+            result.append(x)  # Enter the subtree of x
+            i -= 1
+        else:
+            i -= size  # Skip the whole subtree of x
+    return result
+
+
+def subset_index(subset, n):
+    """
+    Inverse of subset_at: the output index of an increasing list of numbers from 1..n
+    """
+    i = 0
+    prev = 0
+    for value in subset:
+        # Skip the subtrees of every number between the previous element and this one
+        for x in range(prev + 1, value):
+            i += 1 << (n - x)
+        i += 1
+        prev = value
+    return i
+
+
+def subset_bits(indices, n, gray=False):
+    """
+    Decode a batch of indices into a bit-matrix with NumPy
+
+    Args:
+        indices: Array-like of indices in 0..2^n-1
+        n: Size of the ground set (at most 62)
+        gray: Decode Gray-code positions instead of lexicographic ones
+
+    Returns:
+        Boolean array of shape (len(indices), n); column x-1 tells whether x is in the subset
+    """
+    import numpy as np
+
+    rem = np.asarray(indices, dtype=np.int64).copy()
+    bits = np.zeros((rem.size, n), dtype=bool)
+
+    if gray:
+        code = rem ^ (rem >> 1)
+        for x in range(1, n + 1):
+            # Element x is stored at bit n - x so that high bits hold the small elements
+            bits[:, x - 1] = (code >> (n - x)) & 1
+        return bits
+
+    for x in range(1, n + 1):
+        size = np.int64(1) << np.int64(n - x)
+        active = rem > 0
+        take = active & (rem - 1 < size)
+        bits[:, x - 1] = take
+        rem -= np.where(take, 1, np.where(active, size, 0))
+    return bits
+
+
+def _tail_lex(lo, n):
+    """Non-empty subsets of {lo..n} in output order, rendered as strings."""
+    out = []
+
+    def walk(prefix, last):
+        for x in range(last + 1, n + 1):
+            s = prefix + str(x)
+            out.append(s)
+            walk(s + ' ', x)
+
+    walk('', lo - 1)
+    return out
+
+
+def _tail_gray(lo, n):
+    """All subsets of {lo..n} in reflected Gray-code order, rendered with a leading space."""
+    k = n - lo + 1
+    out = []
+    for i in range(1 << k):
+        g = i ^ (i >> 1)
+        out.append(''.join([' ' + str(x) for x in range(lo, n + 1) if g >> (n - x) & 1]))
+    return out
+
+
+def iter_chunks(n, tail=TAIL, chunk_lines=CHUNK_LINES):
+    """
+    Generate every subset in output order (empty subset first) as encoded chunks
+
+    Yields:
+        bytes objects holding newline-terminated lines
+    """
+    k = min(n, tail)
+    head = n - k
+    template = _tail_lex(head + 1, n)
+    pieces = []
+    count = 0
+
+    def visit(prefix, last):
+        # prefix is the rendered head subset; its own line comes before its subtree
+        nonlocal count
+        pieces.append(prefix)
+        count += 1
+        for x in range(last + 1, head + 1):
+            yield from visit(prefix + ' ' + str(x) if prefix else str(x), x)
+        # The tail block follows the whole head subtree
+        if template:
+            if prefix:
+                lead = prefix + ' '
+                pieces.append(lead + ('\n' + lead).join(template))
+            else:
+                pieces.append('\n'.join(template))
+            count += len(template)
+        if count >= chunk_lines:
+            yield
+
+    for _ in visit('', 0):
+        pieces.append('')
+        yield '\n'.join(pieces).encode()
+        pieces.clear()
+        count = 0
+    if pieces:
+        pieces.append('')
+        yield '\n'.join(pieces).encode()
+
+
+def iter_gray_chunks(n, tail=TAIL, chunk_lines=CHUNK_LINES):
+    """
+    Generate every subset in reflected Gray-code order (one element changes per step)
+
+    Yields:
+        bytes objects holding newline-terminated lines, starting with the empty subset
+    """
+    k = min(n, tail)
+    head = n - k
+    forward = _tail_gray(head + 1, n)
+    backward = forward[::-1]
+    # Templates for an empty head drop the leading space
+    forward_bare = [s[1:] for s in forward]
+    backward_bare = forward_bare[::-1]
+
+    pieces = []
+    count = 0
+    for t in range(1 << head):
+        g = t ^ (t >> 1)
+        prefix = ' '.join([str(x) for x in range(1, head + 1) if g >> (head - x) & 1])
+        # Odd blocks walk the tail sequence backwards (reflection property)
+        if prefix:
+            seq = backward if t & 1 else forward
+            pieces.append(prefix + ('\n' + prefix).join(seq))
+        else:
+            seq = backward_bare if t & 1 else forward_bare
+            pieces.append('\n'.join(seq))
+        count += len(seq)
+        if count >= chunk_lines:
+            pieces.append('')
+            yield '\n'.join(pieces).encode()
+            pieces.clear()
+            count = 0
+    if pieces:
+        pieces.append('')
+        yield '\n'.join(pieces).encode()
+
+
+def write_subsets(n, out, gray=False):
+    """
+    Write all subsets of {1..n} to a binary stream, empty subset first
+
+    Args:
+        n: Size of the ground set
+        out: Binary writable stream (e.g. sys.stdout.buffer)
+        gray: Use Gray-code order instead of the lexicographic order of dfs
+    """
+    for chunk in (iter_gray_chunks(n) if gray else iter_chunks(n)):
+        out.write(chunk)
 
-# Print empty line as specified (represents the empty subset, which is lexicographically smallest)
-print()
 
-# Start DFS from each number from 1 to n
-# This ensures we generate all subsets starting with each possible first element
-for start in range(1, n + 1):
-    # Start with a subset containing only the starting number
-    dfs(start, [start])
\ No newline at end of file
+if __name__ == "__main__":
+    # Read input: the maximum number n
+    n = int(input())
+    # The empty line for the empty subset is the first line of the stream;
+    # passing "gray" selects the Gray-code order instead
+    write_subsets(n, sys.stdout.buffer, gray=sys.argv[1:2] == ["gray"])
+    sys.stdout.buffer.flush()
@@ -6,19 +6,45 @@ Approach: Use Depth-First Search (DFS) with backtracking
 - At each position 'u', we try all numbers that haven't been used yet
 - When we reach position 'n', we have a complete permutation and print it
 - After trying a number, we backtrack by marking it as unused again
+
+Iterative engine (used by main):
+- The permutation is stepped in place with the classic next-permutation rule
+  (find the pivot, swap with its successor, reverse the tail), so nothing is allocated per step
+- The engine permutes indices 0..n-1 and maps them through a label table; labels 1..n give
+  ascending lexicographic order and labels n..1 give descending order with the same code
+- The rendered text of every prefix is cached, so a step only re-renders the positions
+  after the pivot, and lines are written in large byte chunks instead of one print each
+- Parallel mode hands each worker a fixed prefix (by default the first element); prefixes
+  are processed in lexicographic order and written back in that order, so the output
+  matches the serial run byte for byte
 """
 
+import os
+import sys
+import time
+from itertools import permutations
+
+# Number of lines collected before a chunk is encoded and handed to the writer
+CHUNK_LINES = 1 << 16
+
 
-def dfs(u):
+def dfs(n, out, u=0, a=None, st=None):
     """
-    DFS function to generate permutations recursively
+    DFS function to generate permutations recursively (reference for the engine below)
     Args:
+        n: Number of elements
+        out: Text stream receiving the lines
         u: Current position in the permutation we are filling
+        a: Current permutation (allocated on the first call)
+        st: Used flags of the numbers 1..n (allocated on the first call)
     """
+    if a is None:
+        a = [0] * n
+        st = [False] * (n + 1)
     # Base case: when we've filled all n positions
     if u == n:
         # Print the complete permutation
-        print(' '.join(map(str, a[:n])))
+        print(' '.join(map(str, a[:n])), file=out)
         return
 
     # Try all numbers from 1 to n at the current position
@@ -27,16 +53,137 @@ def dfs(u):
         if not st[i]:
             st[i] = True  # Mark number i as used
             a[u] = i  # Place number i at current position
-            dfs(u + 1)  # Recursively fill next position
+            dfs(n, out, u + 1, a, st)  # Recursively fill next position
             st[i] = False  # Backtrack: mark number i as unused
 
 
-if __name__ == "__main__":
-    # Read input: the number n
+def iter_chunks(n, descending=False, prefix=(), chunk_lines=CHUNK_LINES):
+    """
+    Generate permutations of 1..n in lexicographic order as encoded output chunks
+
+    Args:
+        n: Number of elements
+        descending: Emit in descending instead of ascending lexicographic order
+        prefix: Fixed leading indices (0-based ranks); only permutations starting
+                with this prefix are emitted
+        chunk_lines: Approximate number of lines per yielded chunk
+
+    Yields:
+        bytes objects holding newline-terminated lines
+    """
+    if n == 0:
+        # The only permutation of nothing is the empty one
+        yield b"\n"
+        return
+
+    labels = [str(v) for v in (range(n, 0, -1) if descending else range(1, n + 1))]
+    depth = len(prefix)
+    used = set(prefix)
+    p = list(prefix) + [v for v in range(n) if v not in used]
+    last = n - 1
+
+    # prefixes[k] is the rendered text of p[:k]
+    prefixes = [''] * n
+    for k in range(1, n):
+        prefixes[k] = prefixes[k - 1] + labels[p[k - 1]] + ' '
+
+    lines = []
+    while True:
+        lines.append(prefixes[last] + labels[p[last]])
+
+        # Find the pivot: the rightmost position smaller than its successor
+        i = n - 2
+        while i >= 0 and p[i] > p[i + 1]:
+            i -= 1
+        # Stop once the step would touch the fixed prefix (or there is no next permutation)
+        if i < depth:
+            break
+
+        # Swap the pivot with the rightmost larger element, then reverse the tail
+        j = last
+        while p[j] < p[i]:
+            j -= 1
+        p[i], p[j] = p[j], p[i]
+        lo, hi = i + 1, last
+        while lo < hi:
+            p[lo], p[hi] = p[hi], p[lo]
+            lo += 1
+            hi -= 1
+
+        # Re-render only the positions after the pivot
+        for k in range(i + 1, n):
+            prefixes[k] = prefixes[k - 1] + labels[p[k - 1]] + ' '
+
+        if len(lines) >= chunk_lines:
+            lines.append('')
+            yield '\n'.join(lines).encode()
+            lines = []
+
+    lines.append('')
+    yield '\n'.join(lines).encode()
+
+
+def _shard(args):
+    """Worker task: render every permutation under one prefix into a single bytes block."""
+    n, descending, prefix = args
+    return b''.join(iter_chunks(n, descending, prefix))
+
+
+def write_permutations(n, out, descending=False, workers=1, depth=1):
+    """
+    Write all permutations of 1..n to a binary stream
+
+    Args:
+        n: Number of elements
+        out: Binary writable stream (e.g. sys.stdout.buffer)
+        descending: Emit in descending instead of ascending lexicographic order
+        workers: Number of processes; 1 generates everything in this process
+        depth: Length of the prefix handed to each worker in parallel mode
+    """
+    if workers <= 1 or n <= depth:
+        for chunk in iter_chunks(n, descending):
+            out.write(chunk)
+        return
+
+    from multiprocessing import Pool
+
+    # permutations() of a sorted range yields the prefixes in lexicographic order
+    tasks = [(n, descending, prefix) for prefix in permutations(range(n), depth)]
+    with Pool(workers) as pool:
+        for block in pool.imap(_shard, tasks):
+            out.write(block)
+
+
+def benchmark():
+    """
+    Report throughput (permutations/sec) for the serial and parallel engines
+    """
+    cores = os.cpu_count() or 1
+    with open(os.devnull, 'wb') as sink:
+        for n in (8, 9, 10):
+            total = 1
+            for v in range(2, n + 1):
+                total *= v
+            for workers in sorted({1, cores}):
+                t0 = time.perf_counter()
+                write_permutations(n, sink, workers=workers)
+                elapsed = time.perf_counter() - t0
+                print(f"n={n}  {total} perms  workers={workers}  "
+                      f"{elapsed:.2f}s  {total / elapsed:,.0f} perm/s")
+
+
+def main():
+    """
+    Read n and stream every permutation; an optional argument sets the worker count
+    """
     n = int(input())
-    # Array to store the current permutation
-    a = [0] * n
-    # Boolean array to track used numbers (index 0 is unused, we use indices 1 to n)
-    st = [False] * (n + 1)
-    # Start DFS from position 0
-    dfs(0)
\ No newline at end of file
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    write_permutations(n, sys.stdout.buffer, workers=workers)
+    sys.stdout.buffer.flush()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["bench"]:
+        benchmark()
+    else:
+        main()
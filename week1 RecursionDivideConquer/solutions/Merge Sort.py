@@ -6,8 +6,63 @@ Approach: Divide and conquer strategy
 - Time complexity: O(n log n) in all cases
 - Space complexity: O(n) for temporary array
 - Stable sorting algorithm (preserves relative order of equal elements)
+
+Bottom-up variant (merge_sort_bottom_up, the default in main):
+- No recursion and no per-level temporary lists: merge passes ping-pong between the
+  input list and one scratch buffer allocated once
+- Natural runs are detected first; strictly descending runs are reversed in place, so
+  sorted and reversed inputs finish after a single scan
+- Runs shorter than MIN_RUN are extended with binary insertion sort before merging
+- Two runs that are already in order are copied with one slice instead of merged
+
+Parallel variant (parallel_merge_sort):
+- The values are copied once into a multiprocessing.shared_memory block viewed as a
+  typed int64 buffer and split into one chunk per worker
+- Each worker sorts its chunk in place inside the shared block with the bottom-up sort,
+  so no element is pickled between processes
+- The parent performs a heap-based k-way merge (heapq.merge) straight from the shared views
+
+External variant (external_sort, "external" in main):
+- For inputs larger than RAM; the same input format also serves Insertion Sort and
+  Selection Sort, whose output is the same sorted line
+- The integer stream is tokenized from fixed-size byte blocks, so the whole input is
+  never held in memory; every chunk that fits the memory budget is sorted with the
+  bottom-up sort and written as a binary int64 run file
+- A chunk holding values outside int64 is written as a decimal text run instead, so any
+  integer main accepts is sorted the same way
+- Binary runs are memory-mapped and read back as typed arrays in blocks, text runs are
+  read line by line, and a heap-based k-way merge combines them
+- At most MAX_MERGE_FANIN runs are open at once: while there are more, groups of runs are
+  merged into new run files, so open files and read buffers (sized from the budget divided
+  by the fan-in) stay bounded however many runs pass 1 produced
+- The last merge writes the output in batches with the exact layout of main
 """
 
+import heapq
+import mmap
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+from bisect import bisect_right
+
+# Shortest run handed to the merge passes; shorter runs are grown by insertion sort
+MIN_RUN = 32
+# Below this many elements per worker the parallel sort falls back to one process
+MIN_PARALLEL_CHUNK = 1 << 14
+# Range of the int64 buffers used by the parallel sort and the binary run files
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+# Default memory budget of the external sort, in bytes
+EXTERNAL_MEMORY = 256 << 20
+# Rough cost of one element while a chunk is sorted: int object, list slot, scratch slot
+BYTES_PER_ELEMENT = 48
+# Size of the byte blocks read from the input stream
+READ_BLOCK = 1 << 20
+# Largest number of runs merged (and open) at the same time by the external sort
+MAX_MERGE_FANIN = 32
+
 
 def merge_sort(q, l, r):
     """
@@ -62,6 +117,360 @@ def merge_sort(q, l, r):
         q[i] = tmp[i - l]
 
 
+def _insertion_sort(q, lo, sorted_end, hi):
+    """
+    Extend the sorted slice q[lo:sorted_end] to cover q[lo:hi] with binary insertion
+    """
+    for p in range(sorted_end, hi):
+        x = q[p]
+        pos = bisect_right(q, x, lo, p)  # bisect_right keeps equal elements stable
+        if pos < p:
+            q[pos + 1:p + 1] = q[pos:p]  # Shift the larger elements with one slice move
+            q[pos] = x
+
+
+def _merge(src, dst, lo, mid, hi):
+    """
+    Merge the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi]
+    """
+    # Runs already in order: one slice copy is enough
+    if src[mid - 1] <= src[mid]:
+        dst[lo:hi] = src[lo:hi]
+        return
+
+    i, j, k = lo, mid, lo
+    a, b = src[i], src[j]
+    while True:
+        if b < a:
+            dst[k] = b  # Take from the right run only when strictly smaller (stable)
+            k += 1
+            j += 1
+            if j == hi:
+                dst[k:hi] = src[i:mid]  # Right run exhausted: copy the rest of the left one
+                return
+            b = src[j]
+        else:
+            dst[k] = a
+            k += 1
+            i += 1
+            if i == mid:
+                dst[k:hi] = src[j:hi]  # Left run exhausted: copy the rest of the right one
+                return
+            a = src[i]
+
+
+def merge_sort_bottom_up(q):
+    """
+    Iterative natural merge sort, sorts q in place
+    Args:
+        q: The list to be sorted
+    """
+    n = len(q)
+
+    # Split the input into natural runs of at least MIN_RUN elements
+    bounds = [0]
+    i = 0
+    while i < n:
+        j = i + 1
+        if j < n and q[j] < q[j - 1]:
+            # Strictly descending run: reverse it in place
+            while j < n and q[j] < q[j - 1]:
+                j += 1
+            q[i:j] = q[i:j][::-1]
+        else:
+            while j < n and q[j] >= q[j - 1]:
+                j += 1
+        end = min(n, i + MIN_RUN)
+        if j < end:
+            _insertion_sort(q, i, j, end)
+            j = end
+        bounds.append(j)
+        i = j
+
+    if len(bounds) <= 2:
+        return
+
+    # Merge neighbouring runs pass by pass, alternating between q and one scratch buffer
+    src, dst = q, [0] * n
+    while len(bounds) > 2:
+        merged = [0]
+        for k in range(0, len(bounds) - 2, 2):
+            _merge(src, dst, bounds[k], bounds[k + 1], bounds[k + 2])
+            merged.append(bounds[k + 2])
+        if len(bounds) % 2 == 0:
+            # Odd run count: the last run is carried over unchanged
+            dst[bounds[-2]:n] = src[bounds[-2]:n]
+            merged.append(n)
+        bounds = merged
+        src, dst = dst, src
+
+    if src is not q:
+        q[:] = src
+
+
+def _sort_shared_chunk(args):
+    """
+    Worker task: sort view[lo:hi] of the shared int64 block in place
+    """
+    from multiprocessing import shared_memory
+
+    name, lo, hi = args
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf.cast('q')
+    part = view[lo:hi].tolist()
+    merge_sort_bottom_up(part)
+    view[lo:hi] = array('q', part)
+    view.release()
+    shm.close()
+
+
+def parallel_merge_sort(q, workers=None):
+    """
+    Multi-process merge sort over shared memory, sorts q in place
+    Args:
+        q: The list of integers to be sorted
+        workers: Number of processes (default: number of CPUs)
+    """
+    from multiprocessing import Pool, shared_memory
+
+    n = len(q)
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, n // MIN_PARALLEL_CHUNK)
+    # Too small to be worth splitting, or values that do not fit a typed buffer
+    if workers <= 1 or min(q) < INT64_MIN or max(q) > INT64_MAX:
+        merge_sort_bottom_up(q)
+        return
+
+    shm = shared_memory.SharedMemory(create=True, size=n * 8)
+    try:
+        view = shm.buf.cast('q')
+        view[:] = array('q', q)
+        bounds = [n * w // workers for w in range(workers + 1)]
+        with Pool(workers) as pool:
+            pool.map(_sort_shared_chunk, [(shm.name, bounds[w], bounds[w + 1])
+                                          for w in range(workers)])
+
+        # k-way merge of the sorted chunks, read straight from the shared block
+        chunks = [view[bounds[w]:bounds[w + 1]] for w in range(workers)]
+        q[:] = heapq.merge(*chunks)
+        for chunk in chunks:
+            chunk.release()
+        view.release()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def merge_sort_top_down(q):
+    """
+    Whole-list wrapper around the recursive merge_sort
+    """
+    merge_sort(q, 0, len(q) - 1)
+
+
+# Sorts selectable from the command line
+SORTS = {
+    "bottomup": merge_sort_bottom_up,
+    "topdown": merge_sort_top_down,
+    "parallel": parallel_merge_sort,
+}
+
+
+def make_input(kind, n):
+    """
+    Benchmark inputs: random, sorted, reversed and sawtooth (ascending ramps of ~1000)
+    """
+    if kind == "random":
+        return [random.randrange(10 ** 9) for _ in range(n)]
+    if kind == "sorted":
+        return list(range(n))
+    if kind == "reversed":
+        return list(range(n, 0, -1))
+    if kind == "sawtooth":
+        return [i % 1000 for i in range(n)]
+    raise ValueError(f"unknown input kind: {kind}")
+
+
+def benchmark(sizes):
+    """
+    Time every selectable sort on every input kind and check it against sorted()
+    """
+    sys.setrecursionlimit(10000)
+    for n in sizes:
+        for kind in ("random", "sorted", "reversed", "sawtooth"):
+            data = make_input(kind, n)
+            expected = sorted(data)
+            for name, sort in SORTS.items():
+                q = data[:]
+                t0 = time.perf_counter()
+                sort(q)
+                elapsed = time.perf_counter() - t0
+                assert q == expected, name
+                print(f"n={n:<9} {kind:<9} {name:<9} {elapsed:.3f}s")
+
+
+def benchmark_parallel(sizes):
+    """
+    Report the speedup of parallel_merge_sort over the single-process bottom-up sort
+    """
+    cores = os.cpu_count() or 1
+    for n in sizes:
+        data = make_input("random", n)
+        q = data[:]
+        t0 = time.perf_counter()
+        merge_sort_bottom_up(q)
+        serial = time.perf_counter() - t0
+
+        p = data[:]
+        t0 = time.perf_counter()
+        parallel_merge_sort(p, cores)
+        parallel = time.perf_counter() - t0
+        assert p == q, "parallel result differs from merge_sort"
+        print(f"n={n:<10} workers={cores:<3} serial {serial:.3f}s  "
+              f"parallel {parallel:.3f}s  speedup {serial / parallel:.2f}x")
+
+
+def read_ints(stream, block_size=READ_BLOCK):
+    """
+    Yield the integers of a binary stream block by block, never holding the whole input
+    """
+    tail = b''
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            break
+        block = tail + block
+        tokens = block.split()
+        # The last token may continue in the next block
+        tail = b'' if block[-1:].isspace() or not tokens else tokens.pop()
+        yield from map(int, tokens)
+    if tail:
+        yield int(tail)
+
+
+def _read_run(path, block_elems):
+    """
+    Yield the values of a binary run file through a memory-mapped int64 view
+    """
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    # The map keeps its own handle, so only one descriptor per run stays open
+    with mm:
+        view = memoryview(mm).cast('q')
+        try:
+            for lo in range(0, len(view), block_elems):
+                yield from view[lo:lo + block_elems].tolist()
+        finally:
+            view.release()
+
+
+def _read_text_run(path):
+    """
+    Yield the values of a text run file (one decimal integer per line)
+    """
+    with open(path, 'rb') as f:
+        for line in f:
+            yield int(line)
+
+
+def _open_run(run, block_elems):
+    """
+    Yield the values of a (path, binary) run in ascending order
+    """
+    path, binary = run
+    return _read_run(path, block_elems) if binary else _read_text_run(path)
+
+
+def _write_run(path, values, binary, batch=1 << 16):
+    """
+    Write ascending values as a binary int64 run file or a decimal text run file
+    """
+    it = iter(values)
+    with open(path, 'wb') as f:
+        while True:
+            part = [v for _, v in zip(range(batch), it)]
+            if not part:
+                break
+            if binary:
+                array('q', part).tofile(f)
+            else:
+                f.write(''.join([f"{v}\n" for v in part]).encode())
+
+
+def external_sort(inp, out, memory_limit=EXTERNAL_MEMORY):
+    """
+    Sort "n, then n integers" from a binary input stream into a binary output stream
+    Args:
+        inp: Binary readable stream in the format of main
+        out: Binary writable stream, receives the same bytes main would print
+        memory_limit: Approximate peak memory budget in bytes
+    """
+    values = read_ints(inp)
+    n = next(values, 0)
+    chunk_elems = max(MIN_RUN, memory_limit // BYTES_PER_ELEMENT)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Pass 1: cut the stream into sorted binary runs
+        runs = []
+        created = 0  # Run files created so far, used for unique names
+        remaining = n
+        while remaining > 0:
+            chunk = []
+            for v in values:
+                chunk.append(v)
+                if len(chunk) == chunk_elems or len(chunk) == remaining:
+                    break
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            merge_sort_bottom_up(chunk)
+            if remaining == 0 and not runs:
+                # Everything fit into one chunk: no run files needed
+                _write_sorted(out, iter(chunk))
+                return
+            path = os.path.join(tmp, f"run{created}")
+            created += 1
+            # chunk is sorted, so its ends decide whether it fits the int64 format
+            binary = INT64_MIN <= chunk[0] and chunk[-1] <= INT64_MAX
+            _write_run(path, chunk, binary)
+            runs.append((path, binary))
+            del chunk
+
+        # Pass 2: k-way merges of at most MAX_MERGE_FANIN runs, one read block per run
+        block_elems = max(MIN_RUN, chunk_elems // (MAX_MERGE_FANIN + 1))
+        while len(runs) > MAX_MERGE_FANIN:
+            merged = []
+            for lo in range(0, len(runs), MAX_MERGE_FANIN):
+                group = runs[lo:lo + MAX_MERGE_FANIN]
+                if len(group) == 1:
+                    merged.extend(group)
+                    continue
+                path = os.path.join(tmp, f"run{created}")
+                created += 1
+                binary = all(b for _, b in group)
+                _write_run(path, heapq.merge(*(_open_run(run, block_elems) for run in group)),
+                           binary)
+                for old, _ in group:
+                    os.remove(old)
+                merged.append((path, binary))
+            runs = merged
+        _write_sorted(out, heapq.merge(*(_open_run(run, block_elems) for run in runs)))
+
+
+def _write_sorted(out, it, batch=1 << 16):
+    """
+    Write space-separated values followed by a newline, batch by batch
+    """
+    sep = b''
+    while True:
+        part = [str(v) for _, v in zip(range(batch), it)]
+        if not part:
+            break
+        out.write(sep + ' '.join(part).encode())
+        sep = b' '
+    out.write(b'\n')
+
+
 def main():
     """
     Main function to handle input and execute merge sort
@@ -70,11 +479,22 @@ def main():
     n = int(input())
     # Read the array to be sorted
     a = list(map(int, input().split()))
-    # Sort the array using merge sort
-    merge_sort(a, 0, n - 1)
+    # Sort the array with the selected merge sort ("bottomup" unless "topdown"/"parallel" is given)
+    mode = sys.argv[1] if len(sys.argv) > 1 else "bottomup"
+    SORTS[mode](a)
     # Print the sorted array
     print(' '.join(map(str, a)))
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if sys.argv[1:2] == ["bench"]:
+        # Optional sizes after "bench", e.g. bench 1000000 10000000
+        benchmark([int(v) for v in sys.argv[2:]] or [10 ** 5, 10 ** 6])
+    elif sys.argv[1:2] == ["bench-parallel"]:
+        benchmark_parallel([int(v) for v in sys.argv[2:]] or [10 ** 6, 10 ** 7])
+    elif sys.argv[1:2] == ["external"]:
+        # Optional memory budget in MiB after "external", e.g. external 64
+        memory = int(sys.argv[2]) << 20 if len(sys.argv) > 2 else EXTERNAL_MEMORY
+        external_sort(sys.stdin.buffer, sys.stdout.buffer, memory)
+    else:
+        main()
@@ -5,20 +5,83 @@ Approach:
 2. For each test case:
    - Read counts of subjects (a), verbs (b), objects (c)
    - Read the actual subjects, verbs, and objects
-3. Use recursive backtracking to generate all combinations of subject-verb-object
+3. Generate all combinations of subject-verb-object in the order of the original
+   depth-first search:
+   - Depth 0: Start with empty sentence, add subjects
+   - Depth 1: Add verbs to current subject
+   - Depth 2: Add objects to complete the sentence
 4. Output all valid sentences followed by a blank line after each test case
 
-The solution uses depth-first search to build sentences:
-- Depth 0: Start with empty sentence, add subjects
-- Depth 1: Add verbs to current subject
-- Depth 2: Add objects to complete the sentence
+Streaming output:
+- Sentence k (0-indexed) is subject k // (b*c), verb (k // c) % b and object k % c, so
+  sentence_at gives O(1) random access and any [start, stop) range can be rendered alone
+  (pagination or sharding of huge test cases)
+- Each "subject verb " prefix is built once and joined with the pre-punctuated objects,
+  and the text is written in large encoded chunks, so no list of all sentences is kept
 """
 
+import sys
+
+# Approximate number of sentences collected before a chunk is encoded and written
+CHUNK_LINES = 1 << 16
+
+
+def sentence_at(k, subjects, verbs, objects):
+    """
+    Return the k-th (0-indexed) sentence of a test case in output order
+    """
+    total = len(subjects) * len(verbs) * len(objects)
+    if k < 0 or k >= total:
+        raise ValueError("k must be between 0 and a*b*c - 1")
+    sv, o = divmod(k, len(objects))
+    s, v = divmod(sv, len(verbs))
+    return f"{subjects[s]} {verbs[v]} {objects[o]}."
+
+
+def iter_sentence_chunks(subjects, verbs, objects, start=0, stop=None, chunk_lines=CHUNK_LINES):
+    """
+    Generate sentences start..stop-1 of a test case as encoded output chunks
+
+    Args:
+        subjects, verbs, objects: Word lists of the test case
+        start: Index of the first sentence to emit
+        stop: Index one past the last sentence (default: all of them)
+        chunk_lines: Approximate number of sentences per yielded chunk
+
+    Yields:
+        bytes objects holding newline-terminated sentences
+    """
+    b, c = len(verbs), len(objects)
+    total = len(subjects) * b * c
+    stop = total if stop is None else min(stop, total)
+    endings = [obj + '.' for obj in objects]
+
+    pieces = []
+    count = 0
+    k = start
+    while k < stop:
+        sv, o = divmod(k, c)
+        s, v = divmod(sv, b)
+        # One prefix per (subject, verb), joined with a run of objects in one call
+        prefix = subjects[s] + ' ' + verbs[v] + ' '
+        hi = min(c, o + stop - k)
+        pieces.append(prefix + ('\n' + prefix).join(endings[o:hi]))
+        count += hi - o
+        k += hi - o
+        if count >= chunk_lines:
+            pieces.append('')
+            yield '\n'.join(pieces).encode()
+            pieces = []
+            count = 0
+    if pieces:
+        pieces.append('')
+        yield '\n'.join(pieces).encode()
+
 
 def main():
-    import sys
     input = sys.stdin.read
     data = input().splitlines()
+    out = sys.stdout.buffer
 
     idx = 0
     T = int(data[idx])
@@ -51,33 +114,12 @@ def main():
             objects.append(data[idx]);
             idx += 1
 
-        # List to store all generated sentences
-        sentences = []
-
-        # Recursive function to generate all sentence combinations
-        def generate(sentence_parts, depth):
-            # Base case: when we have all three components
-            if depth == 0:
-                # Start with subjects at depth 0
-                for sub in subjects:
-                    generate([sub], 1)  # Move to next depth with subject
-            elif depth == 1:
-                # Add verbs at depth 1
-                for verb in verbs:
-                    generate([sentence_parts[0], verb], 2)  # Move to next depth with subject + verb
-            elif depth == 2:
-                # Add objects at depth 2 to complete sentences
-                for obj in objects:
-                    # Format the complete sentence and add to results
-                    sentences.append(f"{sentence_parts[0]} {sentence_parts[1]} {obj}.")
-
-        # Start the recursive generation from depth 0
-        generate([], 0)
-
-        # Output all generated sentences for this test case
-        for sent in sentences:
-            print(sent)
-        print()  # Blank line after each test case
+        # Stream all sentences for this test case
+        for chunk in iter_sentence_chunks(subjects, verbs, objects):
+            out.write(chunk)
+        out.write(b"\n")  # Blank line after each test case
+
+    out.flush()
 
 
 if __name__ == "__main__":
@@ -2,46 +2,100 @@
 Problem: Print numbers in a spiral pattern starting from given number(s)
 
 Approach:
-1. Use DFS to fill a 100x100 grid with numbers in a clockwise spiral pattern
-2. Start from the center (50,50) and move in directions: right, down, left, up
-3. Change direction when encountering an empty cell in the next clockwise direction
-4. After filling, find the bounding box of non-zero cells and print with proper formatting
+1. The spiral starts at the first number and walks down, right, up, left, ... with segment
+   lengths 1, 1, 2, 2, 3, 3, ... (each turn happens as soon as the next direction is free)
+2. Closed form: after 2m segments m(m+1) steps are done and after 2m+1 segments (m+1)^2,
+   so the segment holding offset t follows from m = isqrt(t) and the segment's start
+   position from alternating sums of its lengths; no grid walk or recursion is needed
+3. The canvas is sized exactly from the segment end points (O(sqrt(n)) of them) and every
+   row is rendered into one preallocated byte buffer, so the work is linear in the output
+4. Each number is right-aligned to the widest number and followed by two spaces, empty
+   cells are blank, exactly as before
 """
 
-# Initialize a 100x100 grid with zeros
-g = [[0] * 100 for _ in range(100)]
+import sys
+from math import isqrt
 
-# Global direction variable: 0=right, 1=down, 2=left, 3=up
-d = 3
-# Direction vectors: right, down, left, up
-dxy = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+# Direction of segment j is DIRS[j % 4]: down, right, up, left as (row, col) steps
+DIRS = [(1, 0), (0, 1), (-1, 0), (0, -1)]
 
 
-def dfs(u, v, x, y):
+def _alternating(p):
+    """Sum 1 - 2 + 3 - 4 ... of the first p segment lengths along one axis."""
+    return (p + 1) // 2 if p % 2 else -(p // 2)
+
+
+def _segment(t):
+    """
+    Locate offset t on the spiral
+
+    Returns:
+        (j, start): index of the segment holding t and the offset where it starts
+    """
+    m = isqrt(t)
+    if t >= m * (m + 1):
+        return 2 * m, m * (m + 1)
+    return 2 * m - 1, m * m
+
+
+def spiral_position(t):
     """
-    Recursive function to fill grid with numbers in spiral pattern
+    Position of the t-th number (0-indexed) relative to the first one
 
-    Args:
-        u: current number to place
-        v: target number to stop at
-        x: current x position in grid
-        y: current y position in grid
+    Returns:
+        (row, col) offset from the starting cell
     """
-    global d
-    # Place current number at current position
-    g[x][y] = u
-    # Base case: reached target number
-    if u == v:
-        return
+    j, start = _segment(t)
+    # Row segments are the even ones, column segments the odd ones
+    row = _alternating((j + 1) // 2)
+    col = _alternating(j // 2)
+    dr, dc = DIRS[j % 4]
+    k = t - start
+    return row + k * dr, col + k * dc
 
-    # Calculate next direction (clockwise turn)
-    nd = (d + 1) % 4
-    # Check if cell in next direction is empty
-    if g[x + dxy[nd][0]][y + dxy[nd][1]] == 0:
-        d = nd  # Change direction if empty cell found
 
-    # Recursive call to place next number
-    dfs(u + 1, v, x + dxy[d][0], y + dxy[d][1])
+def render(x, y):
+    """
+    Render the spiral of the numbers x..y
+
+    Returns:
+        The printed text as bytes
+    """
+    total = y - x + 1
+
+    # Split the range into straight segments: (first offset, length, direction)
+    segments = []
+    t = j = 0
+    while t < total:
+        length = min(j // 2 + 1, total - t)
+        segments.append((t, length, DIRS[j % 4]))
+        t += length
+        j += 1
+
+    # Bounding box from the segment end points
+    r_min = c_min = r_max = c_max = 0
+    for t, length, _ in segments:
+        r, c = spiral_position(t + length - 1)
+        r_min, r_max = min(r_min, r), max(r_max, r)
+        c_min, c_max = min(c_min, c), max(c_max, c)
+
+    w = max(len(str(x)), len(str(y)))  # Width of the widest number
+    cell = w + 2  # Number plus two trailing spaces
+    row_len = (c_max - c_min + 1) * cell + 1
+    rows = r_max - r_min + 1
+
+    # Blank canvas with a newline closing every row
+    buf = bytearray(b' ' * (rows * row_len))
+    buf[row_len - 1::row_len] = b'\n' * rows
+
+    for t, length, (dr, dc) in segments:
+        r, c = spiral_position(t)
+        off = (r - r_min) * row_len + (c - c_min) * cell
+        step = dr * row_len + dc * cell
+        for v in range(x + t, x + t + length):
+            buf[off:off + w] = b'%*d' % (w, v)
+            off += step
+    return bytes(buf)
 
 
 def main():
@@ -55,35 +109,9 @@ def main():
         # Two numbers in one line format
         x, y = map(int, data)
 
-    # Start DFS from center of grid
-    dfs(x, y, 50, 50)
-
-    # Find bounding box of non-zero cells
-    fi = fj = 100  # First row and column with non-zero
-    li = lj = 0  # Last row and column with non-zero
-    w = 0  # Maximum width needed for formatting
-
-    # Calculate bounding box and maximum number width
-    for i in range(100):
-        for j in range(100):
-            if g[i][j]:
-                fi = min(fi, i)
-                fj = min(fj, j)
-                li = max(li, i)
-                lj = max(lj, j)
-                w = max(w, len(str(g[i][j])))
-
-    # Print the grid within bounding box
-    for i in range(fi, li + 1):
-        for j in range(fj, lj + 1):
-            if g[i][j]:
-                # Right-align number with calculated width
-                print(f"{g[i][j]:>{w}}", end="  ")
-            else:
-                # Print spaces for empty cells
-                print(" " * w, end="  ")
-        print()  # New line after each row
+    sys.stdout.buffer.write(render(x, y))
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -8,8 +8,21 @@ Approach:
 - The solution explores all possible subsets of tasks to find the maximum number that can be completed
 Time Complexity: O(2^n) where n is the number of tasks (exponential)
 Space Complexity: O(n) for the recursion stack
+
+Polynomial engine (used by main):
+- The best choice is always the k shortest tasks, so the answer is the largest k whose
+  prefix sum of the sorted task times fits the budget
+- Sorting once and building prefix sums costs O(n log n); every budget is then answered
+  by a binary search over the prefix sums, so Q budgets cost O(n log n + Q log n)
+- A negative budget yields -1, the same value the DFS returns
+- The DFS above is kept as the reference implementation for the cross-check harness
 """
 
+import random
+import sys
+from bisect import bisect_right
+from itertools import accumulate
+
 
 def max_tasks_completed(total_time, task_times):
     """
@@ -42,12 +55,59 @@ def max_tasks_completed(total_time, task_times):
     return dfs(0, 0, 0)
 
 
-# Read input values
-total_time = int(input())  # Total available time
-n = int(input())  # Number of tasks
-task_times = []  # List to store time required for each task
-for i in range(n):
-    task_times.append(int(input()))  # Read each task time
+def build_prefix_sums(task_times):
+    """
+    task_times: List of non-negative task durations
+    Returns: prefix[k] = total time of the k shortest tasks (prefix[0] = 0)
+    """
+    return list(accumulate(sorted(task_times), initial=0))
+
+
+def max_tasks_for_budgets(prefix, budgets):
+    """
+    prefix: Prefix sums from build_prefix_sums
+    budgets: Iterable of total_time values
+    Returns: List with the maximum number of tasks for each budget
+    """
+    # The largest k with prefix[k] <= budget
+    return [bisect_right(prefix, budget) - 1 for budget in budgets]
+
+
+def max_tasks_fast(total_time, task_times):
+    """
+    Single-budget convenience wrapper with the same signature as max_tasks_completed
+    """
+    return max_tasks_for_budgets(build_prefix_sums(task_times), [total_time])[0]
+
+
+def cross_check(trials=500, max_n=12):
+    """
+    Compare the prefix-sum engine with the exponential DFS on random small inputs
+    """
+    for _ in range(trials):
+        n = random.randint(0, max_n)
+        task_times = [random.randint(0, 20) for _ in range(n)]
+        budgets = [random.randint(-5, 20 * n + 5) for _ in range(10)]
+        fast = max_tasks_for_budgets(build_prefix_sums(task_times), budgets)
+        slow = [max_tasks_completed(b, task_times) for b in budgets]
+        assert fast == slow, (task_times, budgets, fast, slow)
+    print(f"{trials} random cases match")
+
+
+def main():
+    # Read input values
+    total_time = int(input())  # Total available time
+    n = int(input())  # Number of tasks
+    task_times = []  # List to store time required for each task
+    for i in range(n):
+        task_times.append(int(input()))  # Read each task time
+
+    # Calculate and print the maximum number of tasks that can be completed
+    print(max_tasks_fast(total_time, task_times))
+
 
-# Calculate and print the maximum number of tasks that can be completed
-print(max_tasks_completed(total_time, task_times))
\ No newline at end of file
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["check"]:
+        cross_check()
+    else:
+        main()
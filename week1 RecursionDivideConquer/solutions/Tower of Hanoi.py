@@ -9,8 +9,25 @@ Approach:
    - Move the largest disk from A to C
    - Move n-1 disks from B to C using A as auxiliary
 4. Base case: when only 1 disk remains, move it directly from source to destination
+
+Iterative engine (used by main):
+- Move k (1-indexed, 1..2^n-1) moves disk (trailing zeros of k) + 1 from peg
+  (k & (k-1)) % 3 to peg ((k | (k-1)) + 1) % 3, with peg 0 the source and the target at
+  peg 2 for odd n and peg 1 for even n, so move_at(k) needs no earlier moves and output
+  can be split across workers by ranges of k
+- Within an aligned block of 2^t moves only the small disks 1..t move, and their pegs are
+  the first block's pegs rotated by (block start) % 3; the three rotations are rendered
+  once as text templates, so the whole stream is templates joined with the single moves
+  of the large disks and written in large chunks
 """
 
+import sys
+
+# Number of smallest disks whose move blocks are rendered as templates
+TEMPLATE_DISKS = 12
+# Approximate number of moves collected before a chunk is encoded and written
+CHUNK_LINES = 1 << 16
+
 
 def hanoi(n, a, b, c):
     """
@@ -34,12 +51,73 @@ def hanoi(n, a, b, c):
         hanoi(n - 1, b, a, c)
 
 
-# Read input: n disks and three rod names
-lines = input().split(" ")
-n = int(lines[0])  # Number of disks
-a = lines[1]  # Source rod name
-b = lines[2]  # Auxiliary rod name
-c = lines[3]  # Destination rod name
+def _pegs(n, a, b, c):
+    """Rod names indexed by the peg numbers of the move formula."""
+    return [a, b, c] if n % 2 else [a, c, b]
+
+
+def move_at(k, n, a, b, c):
+    """
+    The k-th move (1-indexed) of hanoi(n, a, b, c) without generating earlier moves
+
+    Returns:
+        (from_rod, disk, to_rod)
+    """
+    if k < 1 or k >= 1 << n:
+        raise ValueError("k must be between 1 and 2^n - 1")
+    pegs = _pegs(n, a, b, c)
+    disk = (k & -k).bit_length()  # Trailing zeros of k, plus one
+    return pegs[(k & (k - 1)) % 3], disk, pegs[((k | (k - 1)) + 1) % 3]
+
+
+def iter_move_chunks(n, a, b, c, chunk_lines=CHUNK_LINES):
+    """
+    Generate the moves of hanoi(n, a, b, c) as encoded output chunks
+
+    Yields:
+        bytes objects holding newline-terminated "from->disk->to" lines
+    """
+    if n < 1:
+        return
+    pegs = _pegs(n, a, b, c)
+    t = min(n, TEMPLATE_DISKS)
+    size = 1 << t
+
+    # Moves 1..2^t-1 of every block, for each of the three peg rotations
+    templates = []
+    for rot in range(3):
+        templates.append('\n'.join(
+            f"{pegs[(rot + (j & (j - 1))) % 3]}->{(j & -j).bit_length()}->"
+            f"{pegs[(rot + (j | (j - 1)) + 1) % 3]}"
+            for j in range(1, size)))
+
+    pieces = []
+    count = 0
+    total = 1 << n
+    for start in range(0, total, size):
+        pieces.append(templates[start % 3])
+        count += size
+        # The move that ends the block belongs to a disk larger than t
+        k = start + size
+        if k < total:
+            src, disk, dst = move_at(k, n, a, b, c)
+            pieces.append(f"{src}->{disk}->{dst}")
+        if count >= chunk_lines or k >= total:
+            pieces.append('')
+            yield '\n'.join(pieces).encode()
+            pieces = []
+            count = 0
+
+
+if __name__ == "__main__":
+    # Read input: n disks and three rod names
+    lines = input().split(" ")
+    n = int(lines[0])  # Number of disks
+    a = lines[1]  # Source rod name
+    b = lines[2]  # Auxiliary rod name
+    c = lines[3]  # Destination rod name
 
-# Solve Tower of Hanoi: move n disks from A to C using B as auxiliary
-hanoi(n, a, c, b)
\ No newline at end of file
+    # Solve Tower of Hanoi with the same argument order as hanoi(n, a, c, b)
+    for chunk in iter_move_chunks(n, a, c, b):
+        sys.stdout.buffer.write(chunk)
+    sys.stdout.buffer.flush()
@@ -5,11 +5,29 @@ Approach:
 2. Iterate over possible y (number of 5's) from 0 to N//5.
 3. For each y, check if (N - 5*y) is non-negative and divisible by 4.
 4. Count all valid y's.
+
+Closed form (used by main):
+- 5 = 1 (mod 4), so N - 5y is divisible by 4 exactly when y = N (mod 4)
+- The valid y are N % 4, N % 4 + 4, ... up to N // 5, which gives
+  count = max(0, (N // 5 - N % 4) // 4 + 1) in O(1)
+- count_many applies the same formula to a whole NumPy array of N in one vectorized pass;
+  count_loop is the original loop, kept as the verification oracle
 """
 
+import random
+import sys
+import time
 
-def main():
-    N = int(input().strip())
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; count_many then falls back to a list
+    np = None
+
+
+def count_loop(N):
+    """
+    Original O(N) count of the solutions of 4x + 5y = N with x, y >= 0
+    """
     count = 0
 
     # y is the number of 5's
@@ -17,9 +35,74 @@ def main():
         remainder = N - 5 * y
         if remainder >= 0 and remainder % 4 == 0:
             count += 1
+    return count
+
+
+def count_closed(N):
+    """
+    O(1) count of the solutions of 4x + 5y = N with x, y >= 0
+    """
+    return max(0, (N // 5 - N % 4) // 4 + 1)
+
+
+def count_many(Ns):
+    """
+    Counts for a batch of N
+
+    Args:
+        Ns: Array-like of integers (int64 range when NumPy is used)
 
-    print(count)
+    Returns:
+        int64 array of counts (a list when NumPy is not installed)
+    """
+    if np is None:
+        return [count_closed(N) for N in Ns]
+    Ns = np.asarray(Ns, dtype=np.int64)
+    # NumPy // and % floor like Python's, so the formula carries over unchanged
+    return np.maximum((Ns // 5 - Ns % 4) // 4 + 1, 0)
+
+
+def cross_check(trials=2000, seed=1):
+    """
+    Compare the closed form and the batch API with the loop oracle
+    """
+    rng = random.Random(seed)
+    Ns = list(range(-10, 200)) + [rng.randint(0, 10 ** 5) for _ in range(trials)]
+    expected = [count_loop(N) for N in Ns]
+    assert [count_closed(N) for N in Ns] == expected
+    assert list(count_many(Ns)) == expected
+    print(f"{len(Ns)} values agree")
+
+
+def benchmark(size=10 ** 6):
+    """
+    Time the batch API on a million values against the per-query loop on a sample
+    """
+    rng = random.Random(2)
+    Ns = [rng.randint(0, 10 ** 6) for _ in range(size)]
+
+    sample = Ns[:200]
+    t0 = time.perf_counter()
+    for N in sample:
+        count_loop(N)
+    loop = (time.perf_counter() - t0) / len(sample)
+
+    t0 = time.perf_counter()
+    count_many(Ns)
+    batch = time.perf_counter() - t0
+    print(f"loop {loop * 1e6:.1f} us/query (x{size} = {loop * size:.1f}s)  "
+          f"batch {batch:.3f}s for {size} queries")
+
+
+def main():
+    N = int(input().strip())
+    print(count_closed(N))
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if sys.argv[1:2] == ["check"]:
+        cross_check()
+    elif sys.argv[1:2] == ["bench"]:
+        benchmark()
+    else:
+        main()
\ No newline at end of file
@@ -6,17 +6,43 @@ Approach:
 3. For each point i, count how many points are in the semicircle starting from i (including diameter endpoints).
 4. Subtract triangles where all points are within a semicircle.
 5. Special handling for even C to avoid overcounting diameter endpoints.
+
+NumPy engine (used by main):
+- cnt is one np.bincount over the positions and the prefix sums one np.cumsum, both int64
+  arrays of length c; the circular window (i, i + c/2] wraps by adding n where i + c/2 >= c,
+  so the doubled arrays of length 2c are no longer needed
+- The three subtraction cases and the even-C correction are whole-array expressions;
+  every term is at most n^3 / 2, so int64 stays exact while n^3 < 2^63 and larger inputs
+  fall back to the original loop (count_loop) with Python integers
+- solve_buffer answers many test cases "n c p_1 .. p_n" stored back to back in one input
+  buffer; a single test case prints exactly what the original program printed
 """
 
+import random
 import sys
+import time
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; every case then uses count_loop
+    np = None
 
-def main():
-    data = sys.stdin.read().split()
-    n = int(data[0])
-    c = int(data[1])
-    p = list(map(int, data[2:2 + n]))
+# Largest n whose terms (at most n^3 / 2) stay exact in int64
+INT64_SAFE_N = 2_097_151
+
+
+def count_loop(n, c, p):
+    """
+    Original counting loop over the doubled cnt and prefix arrays
+
+    Args:
+        n: Number of points
+        c: Circumference (positions are 0..c-1)
+        p: Point positions
 
+    Returns:
+        Number of triangles containing the origin
+    """
     # cnt array for counting occurrences of each position (with circular duplication)
     cnt = [0] * (2 * c)
     for i in range(n):
@@ -66,8 +92,95 @@ def main():
             if u >= 2:
                 res += v * u * (u - 1) // 2
 
-    print(res)
+    return res
+
+
+def count_numpy(n, c, p):
+    """
+    Vectorized count_loop over int64 arrays of length c
+
+    Args:
+        n: Number of points
+        c: Circumference (positions are 0..c-1)
+        p: Point positions (array-like)
+
+    Returns:
+        Number of triangles containing the origin (a Python int)
+    """
+    if np is None or n > INT64_SAFE_N:
+        return count_loop(n, c, [int(x) for x in p])
+
+    cnt = np.bincount(np.asarray(p, dtype=np.int64), minlength=c)
+    prefix = np.cumsum(cnt)
+    half = c // 2
+
+    # Points in (i, i + c/2], wrapping around the circle
+    idx = np.arange(half, c + half)
+    sum_points = prefix[idx % c] - prefix + np.where(idx >= c, n, 0)
+
+    removed = (cnt * (cnt - 1) * (cnt - 2) // 6
+               + cnt * (cnt - 1) // 2 * sum_points
+               + cnt * (sum_points * (sum_points - 1) // 2))
+    res = n * (n - 1) * (n - 2) // 6 - int(removed.sum())
+
+    if c % 2 == 0:
+        # Add back the triangles with two points on one end of a diameter and one on the other
+        u = cnt[:half]
+        v = cnt[half:]
+        res += int((u * (v * (v - 1) // 2) + v * (u * (u - 1) // 2)).sum())
+    return res
+
+
+def solve_buffer(data):
+    """
+    Answer every test case "n c p_1 .. p_n" in a whitespace-separated buffer
+
+    Args:
+        data: bytes or str with the test cases back to back
+
+    Returns:
+        List of answers, one per test case
+    """
+    if np is None:
+        values = [int(tok) for tok in data.split()]
+    else:
+        values = np.array(data.split(), dtype=np.int64)
+
+    answers = []
+    pos = 0
+    while pos + 1 < len(values):
+        n = int(values[pos])
+        c = int(values[pos + 1])
+        answers.append(count_numpy(n, c, values[pos + 2:pos + 2 + n]))
+        pos += 2 + n
+    return answers
+
+
+def benchmark(n=10 ** 6, c=10 ** 7):
+    """
+    Compare count_loop and count_numpy on one large case
+    """
+    rng = random.Random(3)
+    p = [rng.randrange(c) for _ in range(n)]
+
+    t0 = time.perf_counter()
+    expected = count_loop(n, c, p)
+    loop = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    got = count_numpy(n, c, p)
+    vec = time.perf_counter() - t0
+    assert got == expected
+    print(f"n={n} c={c}  loop {loop:.2f}s  numpy {vec:.2f}s")
+
+
+def main():
+    answers = solve_buffer(sys.stdin.buffer.read())
+    print("\n".join(map(str, answers)))
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if sys.argv[1:2] == ["bench"]:
+        benchmark()
+    else:
+        main()
\ No newline at end of file
@@ -12,8 +12,14 @@ Approach:
 4. Track the maximum number of planks (pairs) and how many heights achieve it.
 
 Complexity: O(max(L)^2) = O(2000^2) = 4M operations, feasible.
+
+The per-height loop lives in pair_sums.py (shared with the sibling problem), which computes
+the plank counts of every height at once with NumPy; the original loop is kept there as
+planks_per_height_python.
 """
 
+from pair_sums import best_heights
+
 
 def main():
     import sys
@@ -23,40 +29,7 @@ def main():
     N = int(data[0])
     L = list(map(int, data[1:1 + N]))
 
-    # Frequency array for piece lengths (1 to 2000)
-    freq = [0] * 4005  # Extended to 4005 to avoid index errors
-    for length in L:
-        freq[length] += 1
-
-    max_planks = 0  # Maximum number of planks for any height
-    heights_count = 0  # Number of heights achieving max_planks
-
-    # Check all possible plank heights H (from 2 to 4000)
-    for H in range(2, 4001):
-        planks = 0  # Number of planks we can make of height H
-
-        # Try all possible first piece lengths a
-        for a in range(1, H):
-            b = H - a  # Second piece length
-            # Check if b is within valid range
-            if b < 1 or b > 4000:
-                continue
-
-            if a == b:
-                # Same length pieces: need at least 2 pieces of this length
-                planks += freq[a] // 2
-            else:
-                # Different lengths: count pairs without duplication
-                if a < b:  # This ensures we count each (a,b) pair only once
-                    planks += min(freq[a], freq[b])
-
-        # Update maximum and count
-        if planks > max_planks:
-            max_planks = planks
-            heights_count = 1
-        elif planks == max_planks:
-            heights_count += 1
-
+    max_planks, heights_count = best_heights(L)
     print(max_planks, heights_count)
 
 
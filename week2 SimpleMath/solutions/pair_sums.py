@@ -0,0 +1,162 @@
+"""
+Shared pair-sum engine for "Nailed It!" and "Aromatic Numbers".
+
+Problem: freq[a] pieces have length a. A plank of height H joins two pieces whose lengths add
+up to H, and every piece is used at most once per height, so the number of planks is
+    planks[H] = sum over a < b, a + b = H of min(freq[a], freq[b])  +  freq[H / 2] // 2
+The solutions need the maximum of planks[H] and how many heights reach it.
+
+Approach (planks_per_height):
+1. min(x, y) = number of thresholds t >= 1 with x >= t and y >= t, so the distinct-length part
+   is a sum over t of the pair counts of the indicator vector [freq >= t]; each of those is
+   the self-convolution of the indicator, computed with one FFT for all H at once
+2. Thresholds above a cut-off T are handled directly: only the K lengths with freq > T take
+   part, and each of them adds np.minimum(excess[i], excess[i+1:]) to a whole slice of H
+3. T is chosen to balance T FFTs against K^2 / 2 pair updates, so both small domains (2000
+   lengths) and large ones (10^5 lengths) avoid a quadratic Python loop
+4. All counts are exact: FFT results are small integers and are rounded before use
+
+planks_per_height_python is the original double loop, kept as the reference and as the
+fallback when NumPy is not installed.
+"""
+
+import random
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure Python loop still works
+    np = None
+
+# Smallest length domain: heights 2..2*MIN_DOMAIN are always reported, as in the original code
+MIN_DOMAIN = 2000
+
+
+def planks_per_height_python(freq):
+    """
+    Original double loop: planks[H] for H in 0..2*(len(freq)-1)
+
+    Args:
+        freq: freq[a] = number of pieces of length a (freq[0] is ignored)
+    """
+    top = len(freq) - 1
+    planks = [0] * (2 * top + 1)
+    for H in range(2, 2 * top + 1):
+        total = 0
+        for a in range(max(1, H - top), H):
+            b = H - a
+            if a == b:
+                total += freq[a] // 2
+            elif a < b:
+                total += min(freq[a], freq[b])
+        planks[H] = total
+    return planks
+
+
+def _choose_cutoff(f, nfft):
+    """
+    Threshold T that minimises T FFTs plus the direct work on lengths with freq > T
+    """
+    counts = np.sort(f[f > 0])
+    t = np.arange(int(counts[-1]) + 1)
+    # K[t] = number of lengths with freq > t
+    k = counts.size - np.searchsorted(counts, t, side='right')
+    cost = t * (3 * nfft * np.log2(nfft)) + k * k / 2.0 + 2000.0 * k
+    return int(np.argmin(cost))
+
+
+def planks_per_height(freq):
+    """
+    Vectorized planks[H] for H in 0..2*(len(freq)-1)
+
+    Args:
+        freq: Sequence or array, freq[a] = number of pieces of length a (freq[0] is ignored)
+
+    Returns:
+        int64 array with the number of planks for every height
+    """
+    if np is None:
+        return planks_per_height_python(list(freq))
+
+    f = np.array(freq, dtype=np.int64)
+    f[0] = 0
+    top = f.size - 1
+    size = 2 * top + 1
+    planks = np.zeros(size, dtype=np.int64)
+    if top < 1 or not f.any():
+        return planks
+
+    # Same length used twice: height 2a gets freq[a] // 2 planks
+    planks[0::2] += f // 2
+
+    nfft = 1 << (size - 1).bit_length()
+    cutoff = _choose_cutoff(f, nfft)
+
+    # Thresholds 1..cutoff: pair counts of the indicator [freq >= t] via FFT
+    for t in range(1, cutoff + 1):
+        ind = (f >= t).astype(np.float64)
+        spectrum = np.fft.rfft(ind, nfft)
+        pairs = np.rint(np.fft.irfft(spectrum * spectrum, nfft)[:size]).astype(np.int64)
+        # Remove a + a = H and count every unordered pair {a, b} once
+        pairs[0::2] -= ind.astype(np.int64)
+        planks += pairs // 2
+
+    # Thresholds above the cut-off: direct updates over the few heavy lengths
+    heavy = np.flatnonzero(f > cutoff)
+    excess = f[heavy] - cutoff
+    for i in range(heavy.size - 1):
+        # heavy[i] + heavy[i+1:] are distinct heights, so a fancy-indexed += is safe
+        planks[heavy[i] + heavy[i + 1:]] += np.minimum(excess[i], excess[i + 1:])
+    return planks
+
+
+def best_heights(lengths):
+    """
+    Maximum fence length and the number of heights that reach it
+
+    Args:
+        lengths: Piece lengths (positive integers)
+
+    Returns:
+        (max_planks, heights_count) over the heights 2..2*max(MIN_DOMAIN, max length)
+    """
+    top = max([MIN_DOMAIN] + list(lengths))
+    freq = [0] * (top + 1)
+    for length in lengths:
+        freq[length] += 1
+    planks = planks_per_height(freq)[2:]
+    max_planks = int(max(planks))
+    heights_count = sum(1 for p in planks if p == max_planks) if np is None \
+        else int(np.count_nonzero(np.asarray(planks) == max_planks))
+    return max_planks, heights_count
+
+
+def benchmark():
+    """
+    Before/after runtime on the original domain and on a 10^5-length domain
+    """
+    rng = random.Random(7)
+    lengths = [rng.randint(1, 2000) for _ in range(10 ** 6)]
+    freq = [0] * 2001
+    for length in lengths:
+        freq[length] += 1
+
+    t0 = time.perf_counter()
+    before = planks_per_height_python(freq)
+    loop = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    after = planks_per_height(freq)
+    vec = time.perf_counter() - t0
+    assert list(after) == before
+    print(f"domain 2000:   loop {loop:.3f}s  vectorized {vec:.3f}s")
+
+    freq = [0] + [rng.randint(0, 30) for _ in range(10 ** 5)]
+    t0 = time.perf_counter()
+    planks_per_height(freq)
+    print(f"domain 10^5:   vectorized {time.perf_counter() - t0:.3f}s")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["bench"]:
+        benchmark()
@@ -0,0 +1,285 @@
+"""
+Segmented sieve for prime windows [L, R] far beyond what a sieve from 0 can hold in memory.
+
+Problem (Prime Distance, week7): for every window [L, R] with R up to 2^31 - 1, report the
+closest and the most distant pair of consecutive primes in the window.
+
+Approach:
+1. Base primes up to sqrt(R) are built once with an odd-only bytearray sieve (odd_sieve,
+   also used by Pretty Average Primes) and cached, so later windows with a smaller or
+   equal bound reuse them
+2. The window is processed in fixed blocks of BLOCK_SIZE odd numbers (one byte each, so a
+   block stays in the L1 cache); every base prime keeps its next odd multiple between
+   blocks and clears its multiples in a block with one slice assignment
+3. iter_prime_blocks yields the primes of one block at a time, so memory stays flat no
+   matter how wide the window is; primes_in, gap_stats and main are built on top of it
+4. is_prime_many sieves the blocks that hold many of the queried values and checks the
+   rest with a deterministic Miller-Rabin test
+
+Complexity: O((R - L) log log R + sqrt(R)) time, O(BLOCK_SIZE + sqrt(R) / log R) memory.
+"""
+
+import sys
+import time
+import tracemalloc
+from itertools import compress
+from math import isqrt
+
+# Odd numbers per block: one byte each, small enough to stay in the L1 cache
+BLOCK_SIZE = 1 << 15
+# A block is sieved for is_prime_many once it holds at least this many queried values
+DENSE_HITS = 32
+# Miller-Rabin with the first 12 primes as bases is exact below this bound
+MR_LIMIT = 3317044064679887385961981
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Cached (limit, odd base primes up to limit)
+_BASE = (0, [])
+
+
+def odd_sieve(limit):
+    """
+    Odd-only sieve of Eratosthenes
+
+    Args:
+        limit: Largest number to cover
+
+    Returns:
+        bytearray where entry i is 1 if 2i + 1 is prime (entry 0, the number 1, is 0)
+    """
+    size = (limit + 1) // 2
+    flags = bytearray([1]) * size
+    if size:
+        flags[0] = 0
+    for i in range(1, (isqrt(limit) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            start = p * p // 2  # Index of p^2; smaller multiples were cleared already
+            flags[start::p] = bytes((size - 1 - start) // p + 1)
+    return flags
+
+
+def base_primes(limit):
+    """
+    Odd primes up to limit, cached across calls
+
+    Args:
+        limit: Largest base prime needed (usually isqrt(R))
+
+    Returns:
+        Ascending list of odd primes <= limit (may extend past limit after a larger call)
+    """
+    global _BASE
+    if _BASE[0] < limit:
+        flags = odd_sieve(limit)
+        _BASE = (limit, [2 * i + 1 for i in compress(range(len(flags)), flags)])
+    return _BASE[1]
+
+
+def iter_prime_blocks(L, R, block=BLOCK_SIZE):
+    """
+    Generate the primes in [L, R] one block at a time
+
+    Args:
+        L: Lower bound of the window (inclusive)
+        R: Upper bound of the window (inclusive)
+        block: Number of odd numbers sieved per block
+
+    Yields:
+        Ascending lists of primes; concatenated they are exactly the primes in [L, R]
+    """
+    if block <= 0:
+        raise ValueError("block must be positive")
+    if R < max(L, 2):
+        return
+
+    head = [2] if L <= 2 else []
+    lo = max(L, 3) | 1  # First odd number of the window above 2
+    base = base_primes(isqrt(R))
+
+    # nxt[k] is the next odd multiple of base[k] still to be cleared (never below p^2)
+    nxt = []
+    for p in base:
+        m = max(p * p, (lo + p - 1) // p * p)
+        nxt.append(m if m & 1 else m + p)
+
+    span = 2 * block
+    while lo <= R:
+        hi = min(lo + span - 1, R)
+        n = (hi - lo) // 2 + 1  # Odd numbers lo, lo + 2, ..., <= hi
+        flags = bytearray([1]) * n
+        for k, p in enumerate(base):
+            m = nxt[k]
+            if m > hi:
+                if p * p > hi:
+                    break  # Larger base primes start even later
+                continue
+            i = (m - lo) // 2
+            hits = (n - 1 - i) // p + 1
+            flags[i::p] = bytes(hits)
+            nxt[k] = m + 2 * p * hits
+        yield head + [lo + 2 * i for i in compress(range(n), flags)]
+        head = []
+        lo += span
+
+
+def iter_primes(L, R, block=BLOCK_SIZE):
+    """Generate the primes in [L, R] one by one (flattened iter_prime_blocks)."""
+    for primes in iter_prime_blocks(L, R, block):
+        yield from primes
+
+
+def primes_in(L, R):
+    """
+    All primes in [L, R]
+
+    Returns:
+        Ascending list of primes
+    """
+    result = []
+    for primes in iter_prime_blocks(L, R):
+        result.extend(primes)
+    return result
+
+
+def _miller_rabin(n):
+    """Deterministic primality test for n < MR_LIMIT."""
+    if n < 2:
+        return False
+    for p in MR_BASES:
+        if n % p == 0:
+            return n == p
+    d = n - 1
+    s = 0
+    while not d & 1:
+        d >>= 1
+        s += 1
+    for a in MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_prime_many(values, block=BLOCK_SIZE):
+    """
+    Primality of a batch of numbers
+
+    Args:
+        values: Iterable of integers (any order, repeats allowed, below MR_LIMIT)
+        block: Number of odd numbers per sieved block
+
+    Returns:
+        List of bools in the order of values
+    """
+    values = [int(v) for v in values]
+    if values and max(values) >= MR_LIMIT:
+        raise ValueError("values must be below MR_LIMIT")
+
+    result = [False] * len(values)
+    span = 2 * block
+    # Group the queries by the block that would hold them
+    groups = {}
+    for idx, v in enumerate(values):
+        if v >= 2:
+            groups.setdefault(v // span, []).append(idx)
+
+    for key, idxs in groups.items():
+        if len(idxs) < DENSE_HITS:
+            for idx in idxs:
+                result[idx] = _miller_rabin(values[idx])
+            continue
+        lo = key * span
+        found = set()
+        for primes in iter_prime_blocks(lo, lo + span - 1, block):
+            found.update(primes)
+        for idx in idxs:
+            result[idx] = values[idx] in found
+    return result
+
+
+def gap_stats(L, R, block=BLOCK_SIZE):
+    """
+    Statistics of the gaps between consecutive primes in [L, R], streamed block by block
+
+    Returns:
+        dict with the prime count, the first closest and most distant consecutive pairs
+        (None when there are fewer than two primes), the mean gap and a gap histogram
+    """
+    count = 0
+    first = prev = None
+    closest = distant = None
+    min_gap = max_gap = 0
+    histogram = {}
+    for primes in iter_prime_blocks(L, R, block):
+        for p in primes:
+            if prev is not None:
+                gap = p - prev
+                histogram[gap] = histogram.get(gap, 0) + 1
+                if closest is None or gap < min_gap:
+                    min_gap, closest = gap, (prev, p)
+                if distant is None or gap > max_gap:
+                    max_gap, distant = gap, (prev, p)
+            else:
+                first = p
+            prev = p
+        count += len(primes)
+
+    mean_gap = (prev - first) / (count - 1) if count > 1 else 0.0
+    return {"count": count, "closest": closest, "distant": distant,
+            "mean_gap": mean_gap, "histogram": dict(sorted(histogram.items()))}
+
+
+def _measure(L, R):
+    """Prime count, untraced runtime and traced peak memory of one window."""
+    t0 = time.perf_counter()
+    count = sum(len(primes) for primes in iter_prime_blocks(L, R))
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    for _ in iter_prime_blocks(L, R):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def benchmark():
+    """
+    Time and peak memory for windows starting at 0 and for fixed-width windows as R grows
+    """
+    width = 10 ** 6
+    cases = [(0, R) for R in (10 ** 6, 10 ** 7, 5 * 10 ** 7)]
+    cases += [(R - width, R) for R in (10 ** 8, 10 ** 10, 10 ** 12)]
+    for L, R in cases:
+        base_primes(isqrt(R))  # Base primes are a one-time cost per bound
+        count, elapsed, peak = _measure(L, R)
+        print(f"[{L}, {R}]  {count} primes  {elapsed:.2f}s  peak {peak / 1024:.0f} KiB")
+
+
+def main():
+    """
+    Prime Distance: read windows "L R" until EOF and report the extreme consecutive pairs
+    """
+    data = sys.stdin.read().split()
+    out = []
+    for i in range(0, len(data) - 1, 2):
+        stats = gap_stats(int(data[i]), int(data[i + 1]))
+        if stats["closest"] is None:
+            out.append("There are no adjacent primes.")
+        else:
+            (a, b), (c, d) = stats["closest"], stats["distant"]
+            out.append(f"{a},{b} are closest, {c},{d} are most distant.")
+    print("\n".join(out))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["bench"]:
+        benchmark()
+    else:
+        main()
@@ -6,22 +6,34 @@
 # 4. Initialize running sum s and answer variable
 # 5. For each pair, calculate s - y and update answer if needed, then add x to running sum
 # 6. Output the maximum value found
+#
+# Bulk path (used by main when NumPy is installed):
+# - The whole input buffer is split once and converted into an int64 (n, 2) array
+# - A stable argsort on x + y gives the same order as the list sort with the lambda key
+# - The sum of the earlier x values is cumsum(x) shifted by one, so the answer is
+#   max(prefix_x - y) computed as whole-array expressions
+# - If the totals could leave the int64 range the exact Python loop is used instead
+# - "bench" reports the speedup over the per-line loop
 
+import random
 import sys
+import time
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the loop below still works
+    np = None
 
-def main():
-    # Read number of pairs
-    n = int(sys.stdin.readline().strip())
-    pairs = []
+# Results of the bulk path stay exact while every partial sum is below this bound
+INT64_SAFE = 1 << 62
 
-    # Read all pairs
-    for _ in range(n):
-        x, y = map(int, sys.stdin.readline().split())
-        pairs.append((x, y))
 
+def max_risk_loop(pairs):
+    """
+    Original computation over a list of (x, y) tuples
+    """
     # Sort pairs by (x + y) in ascending order
-    pairs.sort(key=lambda p: p[0] + p[1])
+    pairs = sorted(pairs, key=lambda p: p[0] + p[1])
 
     # Initialize variables
     ans = -10 ** 18  # Very small number
@@ -33,10 +45,80 @@ def main():
         ans = max(ans, s - y)
         # Add current x to running sum
         s += x
+    return ans
+
+
+def max_risk_numpy(cows):
+    """
+    Vectorized computation over an int64 array of shape (n, 2)
+    Returns None when the values are too large for exact int64 arithmetic
+    """
+    n = cows.shape[0]
+    if n == 0:
+        return -10 ** 18
+    x = cows[:, 0]
+    y = cows[:, 1]
+    # Bound every intermediate value (x + y, prefix sums, prefix - y) before trusting int64
+    # (in Python ints: np.abs wraps INT64_MIN to a negative value)
+    bound = max(-int(x.min()), int(x.max())) * n + max(-int(y.min()), int(y.max()))
+    if bound >= INT64_SAFE:
+        return None
+
+    order = np.argsort(x + y, kind='stable')
+    x = x[order]
+    y = y[order]
+    prefix = np.cumsum(x) - x  # Sum of the x values before each cow
+    # The loop starts from -10 ** 18, so the answer never drops below it
+    return max(-10 ** 18, int((prefix - y).max()))
+
+
+def solve_buffer(data):
+    """
+    Answer for a whole input buffer (bytes)
+    """
+    tokens = data.split()
+    n = int(tokens[0])
+    if np is not None:
+        try:
+            cows = np.array(tokens[1:1 + 2 * n], dtype=np.int64).reshape(n, 2)
+        except OverflowError:
+            cows = None  # Values beyond int64: use the exact loop
+        if cows is not None:
+            ans = max_risk_numpy(cows)
+            if ans is not None:
+                return ans
+    values = list(map(int, tokens[1:1 + 2 * n]))
+    return max_risk_loop(list(zip(values[0::2], values[1::2])))
 
-    # Output the result
-    print(ans)
+
+def benchmark(n=10 ** 6):
+    """
+    Compare the per-line loop with the bulk NumPy path on random cows
+    """
+    lines = [str(n)] + [f"{random.randint(1, 10 ** 4)} {random.randint(1, 10 ** 9)}"
+                        for _ in range(n)]
+    data = ("\n".join(lines) + "\n").encode()
+
+    t0 = time.perf_counter()
+    rows = data.split(b"\n")
+    pairs = [tuple(map(int, rows[i].split())) for i in range(1, n + 1)]
+    expected = max_risk_loop(pairs)
+    loop = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    result = solve_buffer(data)
+    bulk = time.perf_counter() - t0
+    assert result == expected
+    print(f"n={n}  loop {loop:.3f}s  bulk {bulk:.3f}s  speedup {loop / bulk:.1f}x")
+
+
+def main():
+    # Read the whole input and solve it in bulk
+    print(solve_buffer(sys.stdin.buffer.read()))
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if sys.argv[1:2] == ["bench"]:
+        benchmark()
+    else:
+        main()
\ No newline at end of file
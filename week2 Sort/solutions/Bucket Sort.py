@@ -14,8 +14,59 @@ Algorithm Approach:
 
 Time Complexity: O(n + m) average case, where m is number of buckets processed
 Space Complexity: O(n)
+
+Vectorized selection (find_kth_smallest_numpy, used by main when NumPy is available
+and every value fits in int64):
+- Bucket boundaries come from quantiles of a random sample, so every bucket receives about
+  the same share of the data even when the values are heavily skewed
+- Bucket indices are assigned with one vectorized searchsorted (or, as a fallback that
+  always splits a range with min < max, exact integer arithmetic over [min, max]); a
+  round that cannot shrink the values ends with a plain sort
+- np.bincount histograms the bucket sizes, a cumulative sum locates the one bucket that
+  holds rank k, and only that bucket is kept; the step repeats while it is still large
+- Each round keeps about 1/num_buckets of the values, so the total work stays O(n)
+
+Streaming selection (find_kth_smallest_stream, "stream <file>" in main):
+- For inputs that do not fit in memory; the source is read again on every pass
+- Pass 1 builds a fixed-size histogram whose buckets are floating-point-like value ranges
+  (sign, bit length and the top HISTOGRAM_BITS bits), so no value range is needed upfront
+- Pass 2 keeps only the values that fall into the bucket holding rank k; if that bucket
+  is still larger than the memory budget, it is split into equal-width sub-buckets with
+  one more pass, so peak memory never depends on n
+- For small k, one pass with a heap of the k smallest values is enough (heapq.nsmallest)
 """
 
+import heapq
+import random
+import sys
+import time
+from collections import Counter
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure Python version still works
+    np = None
+
+# Below this size the remaining bucket is simply sorted
+SMALL_BUCKET = 1 << 10
+# Upper limit for the number of buckets per round of the vectorized version
+MAX_BUCKETS = 1 << 12
+# Sample values per bucket used to estimate the quantile boundaries
+SAMPLES_PER_BUCKET = 16
+# Precision of the streaming histogram: values below 2^HISTOGRAM_BITS get exact buckets
+HISTOGRAM_BITS = 8
+# Number of equal-width sub-buckets when a streaming bucket has to be split again
+REFINE_BUCKETS = 1 << 10
+# Default memory budget of the streaming selection, in bytes
+STREAM_MEMORY = 64 << 20
+# Range of the int64 arrays used by the vectorized version
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+# Rough cost of one value kept in a Python list
+BYTES_PER_VALUE = 40
+# Size of the byte blocks read from an input file
+READ_BLOCK = 1 << 20
+
 
 def find_kth_smallest_bucket_sort(arr, k):
     """
@@ -76,6 +127,192 @@ def find_kth_smallest_bucket_sort(arr, k):
     raise ValueError("k is out of bounds")
 
 
+def find_kth_smallest_numpy(arr, k, seed=0):
+    """
+    Find the k-th smallest element with vectorized, distribution-adaptive buckets
+
+    Args:
+        arr: Sequence or NumPy array of integers that fit in int64
+        k: The k-th smallest element to find (1-indexed)
+        seed: Seed for the boundary sample, so results and timings are reproducible
+
+    Returns:
+        The k-th smallest element in the array
+    """
+    a = np.asarray(arr, dtype=np.int64)
+    if k < 1 or k > a.size:
+        raise ValueError("k must be between 1 and n")
+
+    rng = np.random.default_rng(seed)
+    while a.size > SMALL_BUCKET:
+        lo, hi = a.min(), a.max()
+        if lo == hi:
+            return int(lo)
+
+        num_buckets = min(MAX_BUCKETS, max(2, a.size // 64))
+
+        # Quantile boundaries of a sample adapt the buckets to the distribution
+        sample = np.sort(rng.choice(a, size=min(a.size, num_buckets * SAMPLES_PER_BUCKET)))
+        edges = np.unique(sample[np.linspace(0, sample.size, num_buckets, endpoint=False,
+                                             dtype=np.int64)[1:]])
+        index = np.searchsorted(edges, a, side='right')
+        counts = np.bincount(index, minlength=edges.size + 1)
+
+        if counts.max() == a.size:
+            # The sample could not split this range: fall back to equal-width buckets in
+            # exact integers; a - lo is taken modulo 2^64, which is exact because it is
+            # non-negative and below 2^64 even across the whole int64 range
+            width = (int(hi) - int(lo)) // num_buckets + 1
+            offset = a.astype(np.uint64) - np.uint64(int(lo) % (1 << 64))
+            index = np.minimum(offset // np.uint64(width), num_buckets - 1).astype(np.int64)
+            counts = np.bincount(index, minlength=num_buckets)
+
+        # Find the bucket that holds rank k and keep only its values
+        cumulative = np.cumsum(counts)
+        b = int(np.searchsorted(cumulative, k))
+        if b > 0:
+            k -= int(cumulative[b - 1])
+        kept = a[index == b]
+        if kept.size == a.size:
+            break  # No progress: finish with a plain sort instead of looping
+        a = kept
+
+    return int(np.sort(a)[k - 1])
+
+
+def _histogram_key(v):
+    """
+    Monotone bucket key: exact below 2^HISTOGRAM_BITS, otherwise the top bits of v
+    """
+    if v < 0:
+        return -_histogram_key(-v)
+    e = v.bit_length() - HISTOGRAM_BITS
+    if e <= 0:
+        return v
+    return (e << HISTOGRAM_BITS) + (v >> e)
+
+
+def _histogram_range(key):
+    """
+    Inclusive value range (lo, hi) covered by a histogram key
+    """
+    if key < 0:
+        lo, hi = _histogram_range(-key)
+        return -hi, -lo
+    e = key >> HISTOGRAM_BITS
+    if e == 0:
+        return key, key
+    m = key & ((1 << HISTOGRAM_BITS) - 1)
+    return m << e, ((m + 1) << e) - 1
+
+
+def _locate(counts, k):
+    """
+    Find the bucket holding rank k in a {bucket: count} histogram
+    Returns (bucket, rank inside the bucket)
+    """
+    for bucket in sorted(counts):
+        if k <= counts[bucket]:
+            return bucket, k
+        k -= counts[bucket]
+    raise ValueError("k is out of bounds")
+
+
+def find_kth_smallest_stream(make_stream, k, memory_limit=STREAM_MEMORY):
+    """
+    Find the k-th smallest element of a re-readable integer stream in bounded memory
+
+    Args:
+        make_stream: Callable returning a fresh iterator over the values on every call
+        k: The k-th smallest element to find (1-indexed)
+        memory_limit: Approximate budget in bytes for the values kept in memory
+
+    Returns:
+        The k-th smallest element, the same value find_kth_smallest_bucket_sort returns
+    """
+    if k < 1:
+        raise ValueError("k must be between 1 and n")
+    budget = max(1, memory_limit // BYTES_PER_VALUE)
+
+    # Small k: a single pass keeping only the k smallest values
+    if k <= budget:
+        smallest = heapq.nsmallest(k, make_stream())
+        if len(smallest) < k:
+            raise ValueError("k must be between 1 and n")
+        return smallest[-1]
+
+    # Pass 1: fixed-size histogram over value ranges
+    counts = Counter(map(_histogram_key, make_stream()))
+    key, k = _locate(counts, k)
+    lo, hi = _histogram_range(key)
+    size = counts[key]
+
+    # Split the bucket into equal-width sub-buckets until it fits the budget
+    while size > budget and lo < hi:
+        width = hi - lo + 1
+        counts = Counter((v - lo) * REFINE_BUCKETS // width
+                         for v in make_stream() if lo <= v <= hi)
+        sub, k = _locate(counts, k)
+        size = counts[sub]
+        # Sub-bucket i holds lo + ceil(i * width / B) .. lo + ceil((i + 1) * width / B) - 1
+        lo, hi = (lo + (sub * width + REFINE_BUCKETS - 1) // REFINE_BUCKETS,
+                  lo + ((sub + 1) * width + REFINE_BUCKETS - 1) // REFINE_BUCKETS - 1)
+
+    if lo == hi:
+        return lo
+
+    # Last pass: keep only the values of the target bucket
+    bucket = [v for v in make_stream() if lo <= v <= hi]
+    bucket.sort()
+    return bucket[k - 1]
+
+
+def read_file_ints(path, block_size=READ_BLOCK):
+    """
+    Yield the integers of a text file block by block, never holding the whole file
+    """
+    with open(path, 'rb') as f:
+        tail = b''
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            block = tail + block
+            tokens = block.split()
+            # The last token may continue in the next block
+            tail = b'' if block[-1:].isspace() or not tokens else tokens.pop()
+            yield from map(int, tokens)
+        if tail:
+            yield int(tail)
+
+
+def benchmark(n=10 ** 6):
+    """
+    Compare the pure Python and the vectorized versions on uniform and skewed data
+    """
+    rng = random.Random(1)
+    big = 17 * 10 ** 17
+    # name -> (values, k); the last two are duplicate-heavy ranges float64 cannot split
+    datasets = {
+        "uniform": ([rng.randrange(10 ** 9) for _ in range(n)], n // 3),
+        "exponential": ([int(rng.expovariate(1e-3)) for _ in range(n)], n // 3),
+        "pareto": ([int(rng.paretovariate(1.1) * 100) for _ in range(n)], n // 3),
+        "clustered": ([rng.choice((0, 10 ** 9)) + rng.randrange(100) for _ in range(n)], n // 3),
+        "near 2^60": ([big] * (n - 1) + [big + 1], n),
+        "int64 ends": ([INT64_MIN] * (n // 2) + [INT64_MAX] * (n - n // 2 - 1) + [0], n // 2 + 1),
+    }
+    for name, (arr, k) in datasets.items():
+        expected = sorted(arr)[k - 1]
+        results = []
+        for label, fn in (("python", find_kth_smallest_bucket_sort),
+                          ("numpy", find_kth_smallest_numpy)):
+            t0 = time.perf_counter()
+            value = fn(arr, k)
+            results.append(f"{label} {time.perf_counter() - t0:.3f}s")
+            assert value == expected, (name, label)
+        print(f"{name:<12} n={n}  " + "  ".join(results))
+
+
 def main():
     """
     Main function to handle input and output
@@ -95,8 +332,12 @@ def main():
         print(f"Error: k must be between 1 and {n}")
         return
 
-    # Find the k-th smallest element
-    kth_smallest = find_kth_smallest_bucket_sort(arr, k)
+    # Find the k-th smallest element (vectorized when NumPy is installed and the values
+    # fit in int64; larger values keep the exact bucket sort)
+    if np is not None and INT64_MIN <= min(arr) and max(arr) <= INT64_MAX:
+        kth_smallest = find_kth_smallest_numpy(arr, k)
+    else:
+        kth_smallest = find_kth_smallest_bucket_sort(arr, k)
 
     # Output the result
     print(kth_smallest)
@@ -104,4 +345,13 @@ def main():
 
 # Execute the program
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if sys.argv[1:2] == ["bench"]:
+        benchmark()
+    elif sys.argv[1:2] == ["stream"]:
+        # stream <input file> [budget MiB]: same input format, read again on every pass
+        path = sys.argv[2]
+        memory = int(sys.argv[3]) << 20 if len(sys.argv) > 3 else STREAM_MEMORY
+        n, k = islice(read_file_ints(path), 2)
+        print(find_kth_smallest_stream(lambda: islice(read_file_ints(path), 2, 2 + n), k, memory))
+    else:
+        main()
\ No newline at end of file
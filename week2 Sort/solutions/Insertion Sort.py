@@ -16,8 +16,25 @@ Algorithm Approach:
 Time Complexity: O(n²) in worst case, O(n) in best case (already sorted)
 Space Complexity: O(1) - in-place sorting
 Stability: Stable (equal elements maintain relative order)
+
+Hybrid kernel (hybrid_insertion_sort, used by main):
+- Binary insertion finds the slot with bisect (O(log i) comparisons) and shifts the
+  larger elements with one slice assignment instead of one Python-level move each
+- Up to RUN_THRESHOLD elements that is the whole sort; larger arrays are cut into runs of
+  RUN_THRESHOLD elements, each run is binary-insertion sorted, and neighbouring runs are
+  merged pass by pass through one scratch buffer (O(n log n) overall)
+- Runs that are already in order are copied instead of merged, so nearly sorted input
+  stays close to linear
 """
 
+import random
+import sys
+import time
+from bisect import bisect_right
+
+# Arrays up to this size are sorted by binary insertion alone; larger ones use it per run
+RUN_THRESHOLD = 64
+
 
 def insertion_sort(arr):
     """
@@ -50,6 +67,118 @@ def insertion_sort(arr):
     return arr
 
 
+def binary_insertion_sort(arr, lo=0, hi=None):
+    """
+    Sorts arr[lo:hi] in place with binary search and slice moves
+
+    Args:
+        arr: List of integers
+        lo: First index of the range
+        hi: One past the last index of the range (default: len(arr))
+
+    Returns:
+        The same list, with the range sorted
+    """
+    if hi is None:
+        hi = len(arr)
+    for i in range(lo + 1, hi):
+        key = arr[i]
+        # bisect_right puts key after equal elements, which keeps the sort stable
+        pos = bisect_right(arr, key, lo, i)
+        if pos < i:
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = key
+    return arr
+
+
+def _merge(src, dst, lo, mid, hi):
+    """
+    Merges the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi]
+    """
+    if src[mid - 1] <= src[mid]:
+        # Runs already in order
+        dst[lo:hi] = src[lo:hi]
+        return
+    i, j, k = lo, mid, lo
+    a, b = src[i], src[j]
+    while True:
+        if b < a:
+            dst[k] = b
+            k += 1
+            j += 1
+            if j == hi:
+                dst[k:hi] = src[i:mid]
+                return
+            b = src[j]
+        else:
+            dst[k] = a
+            k += 1
+            i += 1
+            if i == mid:
+                dst[k:hi] = src[j:hi]
+                return
+            a = src[i]
+
+
+def hybrid_insertion_sort(arr):
+    """
+    Binary insertion sort for short arrays, run-based merge sort above RUN_THRESHOLD
+
+    Args:
+        arr: List of integers to be sorted
+
+    Returns:
+        List of integers sorted in ascending order (the same list, sorted in place)
+    """
+    n = len(arr)
+    if n <= RUN_THRESHOLD:
+        return binary_insertion_sort(arr)
+
+    # Sort fixed-size runs with the insertion kernel
+    for lo in range(0, n, RUN_THRESHOLD):
+        binary_insertion_sort(arr, lo, min(lo + RUN_THRESHOLD, n))
+
+    # Merge neighbouring runs, doubling the width each pass
+    src, dst = arr, [0] * n
+    width = RUN_THRESHOLD
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid < hi:
+                _merge(src, dst, lo, mid, hi)
+            else:
+                dst[lo:hi] = src[lo:hi]
+        src, dst = dst, src
+        width *= 2
+
+    if src is not arr:
+        arr[:] = src
+    return arr
+
+
+def benchmark(sizes=(1000, 5000, 20000)):
+    """
+    Compares the original, binary and hybrid insertion sorts on random and nearly sorted data
+    """
+    for n in sizes:
+        nearly = list(range(n))
+        for _ in range(n // 100 + 1):
+            i, j = random.randrange(n), random.randrange(n)
+            nearly[i], nearly[j] = nearly[j], nearly[i]
+        cases = {"random": [random.randrange(n) for _ in range(n)], "nearly sorted": nearly}
+        for name, data in cases.items():
+            expected = sorted(data)
+            timings = []
+            for label, sort in (("linear", insertion_sort), ("binary", binary_insertion_sort),
+                                ("hybrid", hybrid_insertion_sort)):
+                arr = data[:]
+                t0 = time.perf_counter()
+                assert sort(arr) == expected, label
+                timings.append(f"{label} {time.perf_counter() - t0:.4f}s")
+            print(f"n={n:<6} {name:<14} " + "  ".join(timings))
+
+
 def main():
     """
     Main function to handle input and output
@@ -60,8 +189,8 @@ def main():
     # Read the array of n integers
     arr = list(map(int, input().strip().split()))
 
-    # Sort the array using insertion sort
-    sorted_arr = insertion_sort(arr)
+    # Sort the array using the hybrid insertion sort kernel
+    sorted_arr = hybrid_insertion_sort(arr)
 
     # Output the sorted array as space-separated values
     print(" ".join(map(str, sorted_arr)))
@@ -69,4 +198,7 @@ def main():
 
 # Execute the program
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if sys.argv[1:2] == ["bench"]:
+        benchmark()
+    else:
+        main()
\ No newline at end of file
@@ -4,6 +4,140 @@
 # 2. Sort the list in ascending order
 # 3. For each element at index i, multiply it by (n-i-1) and accumulate the result
 # 4. Output the final accumulated result
+#
+# Bounded service times:
+# - Counting sort: with values in 0..max_value the sorted order is just the value counts,
+#   and c equal values v starting at sorted index i add v * (c*(n-1-i) - c*(c-1)/2), so the
+#   weighted sum needs O(n + max_value) time and no comparison sort
+# - With NumPy the counts are expanded by np.repeat and the sum is one dot product with
+#   the weights n-1, ..., 0 (only when the result is known to fit in int64)
+# - WaitingQueue keeps the total under insertions and removals: adding v moves nobody's
+#   weight except that every element <= v waits for one more person, so the total grows by
+#   v * (number of elements > v) + (sum of elements <= v); two Fenwick trees over value
+#   counts and value sums answer both terms in O(log max_value)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure Python paths still work
+    np = None
+
+# Largest service time for which main uses the counting sort
+COUNTING_LIMIT = 1 << 20
+
+
+def weighted_sum_sorted(a):
+    """
+    Original O(n log n) computation: sort, then accumulate a[i] * (n - i - 1)
+    """
+    a = sorted(a)
+    n = len(a)
+    res = 0
+    for i in range(n):
+        res += a[i] * (n - i - 1)
+    return res
+
+
+def weighted_sum_counting(a, max_value):
+    """
+    Same result as weighted_sum_sorted for integers in 0..max_value, via counting sort
+    """
+    n = len(a)
+    if np is not None and n and max_value * n * n < 1 << 62:
+        counts = np.bincount(np.asarray(a, dtype=np.int64), minlength=max_value + 1)
+        ordered = np.repeat(np.arange(max_value + 1, dtype=np.int64), counts)
+        return int(np.dot(ordered, np.arange(n - 1, -1, -1, dtype=np.int64)))
+
+    counts = [0] * (max_value + 1)
+    for v in a:
+        counts[v] += 1
+    res = 0
+    i = 0  # Sorted index of the first copy of the current value
+    for v, c in enumerate(counts):
+        if c:
+            res += v * (c * (n - 1 - i) - c * (c - 1) // 2)
+            i += c
+    return res
+
+
+class Fenwick:
+    def __init__(self, n):
+        """
+        Binary indexed tree over positions 0..n-1
+        """
+        self.n = n
+        self.tree = [0] * (n + 1)
+
+    def add(self, i, delta):
+        """
+        Add delta at position i
+        """
+        i += 1
+        while i <= self.n:
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i):
+        """
+        Sum of positions 0..i (0 when i < 0)
+        """
+        i = min(i, self.n - 1) + 1
+        s = 0
+        while i > 0:
+            s += self.tree[i]
+            i -= i & -i
+        return s
+
+
+class WaitingQueue:
+    def __init__(self, max_value):
+        """
+        Multiset of service times in 0..max_value that maintains the total waiting time
+
+        Args:
+            max_value: largest service time that will be inserted
+        """
+        self.max_value = max_value
+        self.count = Fenwick(max_value + 1)  # How many people have each service time
+        self.sum = Fenwick(max_value + 1)  # Total service time per value
+        self.size = 0
+        self.total = 0  # Weighted sum of the sorted queue
+
+    def _check(self, v):
+        """
+        Reject service times the trees cannot hold
+        """
+        if not 0 <= v <= self.max_value:
+            raise ValueError(f"service time must be between 0 and {self.max_value}")
+
+    def _delta(self, v):
+        """
+        Change of the total when v joins the current multiset
+        """
+        greater = self.size - self.count.prefix(v)
+        return v * greater + self.sum.prefix(v)
+
+    def add(self, v):
+        """
+        Insert one person with service time v
+        """
+        self._check(v)
+        self.total += self._delta(v)
+        self.count.add(v, 1)
+        self.sum.add(v, v)
+        self.size += 1
+
+    def remove(self, v):
+        """
+        Remove one person with service time v (must be present)
+        """
+        self._check(v)
+        if self.count.prefix(v) - self.count.prefix(v - 1) == 0:
+            raise ValueError(f"no person with service time {v} in the queue")
+        self.count.add(v, -1)
+        self.sum.add(v, -v)
+        self.size -= 1
+        self.total -= self._delta(v)
+
 
 def main():
     # Read number of elements
@@ -12,19 +146,15 @@ def main():
     # Read the list of integers
     a = list(map(int, input().split()))
 
-    # Sort the array in ascending order
-    a.sort()
-
-    # Initialize result variable
-    res = 0
-
-    # Calculate weighted sum
-    for i in range(n):
-        res += a[i] * (n - i - 1)
+    # Counting sort for small non-negative service times, comparison sort otherwise
+    if a and min(a) >= 0 and max(a) <= COUNTING_LIMIT:
+        res = weighted_sum_counting(a, max(a))
+    else:
+        res = weighted_sum_sorted(a)
 
     # Output the result
     print(res)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -5,6 +5,32 @@
 # 3. Use quickselect (modified quicksort) to partially sort the array
 # 4. Recursively partition the array until the k-th element is in its correct position
 # 5. Output the k-th smallest element (0-indexed in array, so k-1)
+#
+# Selection engine (used by main):
+# - quick_select reuses the Hoare partition of quick_sort but only continues into the side
+#   that contains k, so the expected cost is O(n) instead of O(n log n)
+# - After about 2*log2(n) partitions without finishing, the pivot switches to the median
+#   of medians (groups of five), which keeps adversarial inputs linear (introselect)
+# - multi_select answers a batch of ranks in one call: each partition splits the sorted
+#   list of requested ranks, and a range is only refined while it still holds one of them
+#
+# Hardened sort (intro_sort):
+# - No recursion: ranges wait on an explicit stack, and the loop always continues with the
+#   smaller side while the larger one is pushed, so the stack holds O(log n) ranges
+# - Dutch-flag three-way partitioning puts all keys equal to the pivot in their final
+#   place at once, so duplicate-heavy inputs do not degrade
+# - The pivot is the median of three for small ranges and Tukey's ninther for large ones
+# - A range that exceeds the depth limit is finished with heapsort, bounding the worst
+#   case at O(n log n); short ranges are finished with binary insertion sort
+# - adversarial_inputs builds inputs that hurt naive quicksorts, "bench" times
+#   quick_sort and intro_sort on them
+
+import heapq
+import random
+import sys
+import time
+from bisect import bisect_right
+
 
 def quick_sort(q, l, r):
     """
@@ -40,6 +66,250 @@ def quick_sort(q, l, r):
     quick_sort(q, j + 1, r)
 
 
+def partition(q, l, r):
+    """
+    Hoare partition of q[l..r] around the pivot q[(l + r) // 2], as in quick_sort
+    Returns j with l <= j < r such that q[l..j] <= pivot <= q[j+1..r]
+    """
+    i = l - 1
+    j = r + 1
+    x = q[(i + j) // 2]
+    while i < j:
+        i += 1
+        while q[i] < x:
+            i += 1
+        j -= 1
+        while q[j] > x:
+            j -= 1
+        if i < j:
+            q[i], q[j] = q[j], q[i]
+    return j
+
+
+def median_of_medians(q, l, r):
+    """
+    Move a pivot that is guaranteed to be away from both ends of q[l..r] to the middle
+    position used by partition: the median of the medians of groups of five
+    """
+    if r - l < 5:
+        x = sorted(q[l:r + 1])[(r - l) // 2]
+    else:
+        medians = []
+        for i in range(l, r + 1, 5):
+            group = sorted(q[i:min(i + 5, r + 1)])
+            medians.append(group[len(group) // 2])
+        x = quick_select(medians, len(medians) // 2)
+    p = q.index(x, l, r + 1)
+    m = (l + r) // 2
+    q[p], q[m] = q[m], q[p]
+
+
+def _depth_limit(size):
+    """Number of middle-pivot partitions allowed before switching to median of medians."""
+    return 2 * max(size, 1).bit_length()
+
+
+def quick_select(q, k, l=0, r=None):
+    """
+    Place the k-th smallest (0-indexed) element of q[l..r] at q[k] and return it
+    """
+    if r is None:
+        r = len(q) - 1
+    budget = _depth_limit(r - l + 1)
+    while l < r:
+        if budget > 0:
+            budget -= 1  # Middle pivot, same as quick_sort
+        else:
+            median_of_medians(q, l, r)
+        j = partition(q, l, r)
+        # Continue only into the side that contains k
+        if k <= j:
+            r = j
+        else:
+            l = j + 1
+    return q[k]
+
+
+def multi_select(q, ks):
+    """
+    Answer several order statistics at once
+
+    Args:
+        q: List of numbers (partially reordered in place)
+        ks: Iterable of 0-indexed ranks
+
+    Returns:
+        List with the k-th smallest element for every k in ks, in the same order
+    """
+    ks = list(ks)
+    targets = sorted(set(ks))
+    if not targets:
+        return []
+    # Each entry: range l..r, slice [lo, hi) of targets inside it, remaining budget
+    stack = [(0, len(q) - 1, 0, len(targets), _depth_limit(len(q)))]
+    while stack:
+        l, r, lo, hi, budget = stack.pop()
+        if l >= r or lo >= hi:
+            continue
+        if budget > 0:
+            budget -= 1
+        else:
+            median_of_medians(q, l, r)
+        j = partition(q, l, r)
+        # Ranks <= j stay on the left, the others go right
+        mid = bisect_right(targets, j, lo, hi)
+        stack.append((l, j, lo, mid, budget))
+        stack.append((j + 1, r, mid, hi, budget))
+    return [q[k] for k in ks]
+
+
+# Ranges of at most this many elements are finished with insertion sort
+INSERTION_THRESHOLD = 16
+# Ranges of at least this many elements use the ninther instead of the median of three
+NINTHER_THRESHOLD = 40
+
+
+def _median3(q, a, b, c):
+    """Index of the median of q[a], q[b], q[c]."""
+    if q[a] < q[b]:
+        if q[b] < q[c]:
+            return b
+        return c if q[a] < q[c] else a
+    if q[a] < q[c]:
+        return a
+    return c if q[b] < q[c] else b
+
+
+def choose_pivot(q, l, r):
+    """
+    Pivot value for q[l..r]: median of three, or Tukey's ninther for large ranges
+    """
+    m = (l + r) // 2
+    if r - l + 1 < NINTHER_THRESHOLD:
+        return q[_median3(q, l, m, r)]
+    step = (r - l + 1) // 8
+    return q[_median3(q,
+                      _median3(q, l, l + step, l + 2 * step),
+                      _median3(q, m - step, m, m + step),
+                      _median3(q, r - 2 * step, r - step, r))]
+
+
+def three_way_partition(q, l, r, x):
+    """
+    Dutch-flag partition of q[l..r] around the value x
+    Returns (lt, gt) with q[l..lt-1] < x, q[lt..gt] == x and q[gt+1..r] > x
+    """
+    lt, i, gt = l, l, r
+    while i <= gt:
+        v = q[i]
+        if v < x:
+            q[lt], q[i] = v, q[lt]
+            lt += 1
+            i += 1
+        elif v > x:
+            q[gt], q[i] = v, q[gt]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def heap_sort_range(q, l, r):
+    """
+    Heapsort fallback for q[l..r]
+    """
+    heap = q[l:r + 1]
+    heapq.heapify(heap)
+    q[l:r + 1] = [heapq.heappop(heap) for _ in range(len(heap))]
+
+
+def insertion_sort_range(q, l, r):
+    """
+    Binary insertion sort for a short range q[l..r]
+    """
+    for p in range(l + 1, r + 1):
+        x = q[p]
+        pos = bisect_right(q, x, l, p)
+        if pos < p:
+            q[pos + 1:p + 1] = q[pos:p]
+            q[pos] = x
+
+
+def intro_sort(q):
+    """
+    Iterative introsort with three-way partitioning, sorts q in place
+    """
+    n = len(q)
+    stack = [(0, n - 1, _depth_limit(n))]
+    while stack:
+        l, r, depth = stack.pop()
+        while r - l + 1 > INSERTION_THRESHOLD:
+            if depth == 0:
+                heap_sort_range(q, l, r)
+                break
+            depth -= 1
+            lt, gt = three_way_partition(q, l, r, choose_pivot(q, l, r))
+            # Keep working on the smaller side, postpone the larger one
+            if lt - l < r - gt:
+                stack.append((gt + 1, r, depth))
+                r = lt - 1
+            else:
+                stack.append((l, lt - 1, depth))
+                l = gt + 1
+        else:
+            insertion_sort_range(q, l, r)
+
+
+def adversarial_inputs(n):
+    """
+    Inputs that break or slow down naive quicksorts
+    Returns a dict from a descriptive name to a list of n integers
+    """
+    k = n // 2
+    # Musser's median-of-three killer sequence is defined for lengths 2h with h even; it is
+    # built on the longest such prefix and the remaining values follow in order
+    h = n // 4 * 2
+    killer = list(range(1, n + 1))
+    for i in range(1, h + 1):
+        if i % 2 == 1:
+            killer[i - 1] = i
+            killer[i] = h + i
+        killer[h + i - 1] = 2 * i
+    return {
+        "random": [random.randrange(n) for _ in range(n)],
+        "sorted": list(range(n)),
+        "reversed": list(range(n, 0, -1)),
+        "all equal": [7] * n,
+        "few distinct": [random.randrange(3) for _ in range(n)],
+        "organ pipe": list(range(k)) + list(range(n - k, 0, -1)),
+        "median-3 killer": killer,
+    }
+
+
+def benchmark(n):
+    """
+    Time the recursive quick_sort and intro_sort on every adversarial input
+    """
+    for name, data in adversarial_inputs(n).items():
+        expected = sorted(data)
+        if name == "median-3 killer":
+            assert expected == list(range(1, n + 1)), "killer is not a permutation of 1..n"
+        for label in ("quick_sort", "intro_sort"):
+            q = data[:]
+            t0 = time.perf_counter()
+            try:
+                if label == "quick_sort":
+                    quick_sort(q, 0, n - 1)
+                else:
+                    intro_sort(q)
+            except RecursionError:
+                print(f"{name:<16} {label:<11} RecursionError")
+                continue
+            elapsed = time.perf_counter() - t0
+            assert q == expected, (name, label)
+            print(f"{name:<16} {label:<11} {elapsed:.3f}s")
+
+
 def main():
     # Read n and k
     n, k = map(int, input().split())
@@ -47,12 +317,13 @@ def main():
     # Read the array
     a = list(map(int, input().split()))
 
-    # Sort the array using quick sort
-    quick_sort(a, 0, n - 1)
-
-    # Output the k-th smallest element (1-indexed in problem, 0-indexed in array)
-    print(a[k - 1])
+    # Select the k-th smallest element (1-indexed in problem, 0-indexed in array)
+    print(quick_select(a, k - 1, 0, n - 1))
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if sys.argv[1:2] == ["bench"]:
+        # Optional size after "bench", e.g. bench 1000000
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 10 ** 5)
+    else:
+        main()
\ No newline at end of file
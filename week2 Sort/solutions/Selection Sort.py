@@ -6,15 +6,25 @@
 #    - Find the minimum element in the remaining unsorted part (from i to n-1)
 #    - Swap the minimum element with the element at position i
 # 3. Output the sorted array
+#
+# Heap selection (partial_sort, used by main):
+# - The repeated "find the minimum of the unsorted part" is served by a binary heap:
+#   heapify builds it in O(n) and every further minimum costs O(log n)
+# - The k smallest elements in order therefore cost O(n + k log n); callers that only need
+#   a top-k report stop after k selections, and the full sort is the case k = n
+# - selection_sort keeps the original O(n^2) min-scan for comparison
 
-def main():
-    # Read number of elements
-    n = int(input().strip())
+import heapq
+import random
+import sys
+import time
 
-    # Read the array
-    q = list(map(int, input().split()))
 
-    # Selection sort implementation
+def selection_sort(q):
+    """
+    Original selection sort: sorts q in place with a min-scan per position
+    """
+    n = len(q)
     for i in range(n - 1):
         # Find index of minimum element in unsorted part
         min_index = i
@@ -24,10 +34,52 @@ def main():
 
         # Swap the found minimum element with the first element of unsorted part
         q[i], q[min_index] = q[min_index], q[i]
+    return q
+
+
+def partial_sort(q, k):
+    """
+    Return the k smallest elements of q in ascending order (q itself is not modified)
+    """
+    k = max(0, min(k, len(q)))
+    heap = list(q)
+    heapq.heapify(heap)
+    return [heapq.heappop(heap) for _ in range(k)]
+
+
+def benchmark(n=5000):
+    """
+    Time partial_sort for k in {10, 1000, n} against the full min-scan selection sort
+    """
+    data = [random.randrange(10 ** 9) for _ in range(n)]
+    expected = sorted(data)
+    for k in (10, 1000, n):
+        t0 = time.perf_counter()
+        result = partial_sort(data, k)
+        elapsed = time.perf_counter() - t0
+        assert result == expected[:k]
+        print(f"n={n} k={k:<6} partial_sort {elapsed:.4f}s")
+    t0 = time.perf_counter()
+    assert selection_sort(data[:]) == expected
+    print(f"n={n} k={n:<6} selection_sort {time.perf_counter() - t0:.4f}s")
+
+
+def main():
+    # Read number of elements
+    n = int(input().strip())
+
+    # Read the array
+    q = list(map(int, input().split()))
+
+    # Full sort: select all n elements from the heap
+    q = partial_sort(q, n)
 
     # Output the sorted array
     print(' '.join(map(str, q)))
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if sys.argv[1:2] == ["bench"]:
+        benchmark()
+    else:
+        main()
@@ -6,6 +6,66 @@
 # 4. For each interval, try to find the largest point that falls within the interval
 # 5. If found and the point has remaining quantity, use one and increment count
 # 6. Output the total number of successful matches
+#
+# Matching engine (max_matches, used by main):
+# - Equal point values are merged into one sorted array of distinct values with counts
+#   (non-positive quantities are dropped, as the scan skips them)
+# - The largest point <= interval_end is found with bisect; a union-find "next available"
+#   array then skips to the nearest value on the left that still has quantity left, and a
+#   value is unioned with its left neighbour once it is used up
+# - Each interval costs O(log m) amortized, O((n + m) log m) overall, with the same
+#   choices (largest usable point) and therefore the same count as the linear scan
+
+from bisect import bisect_right
+
+
+def max_matches(intervals, points):
+    """
+    Count matches between intervals and points with quantities
+
+    Args:
+        intervals: List of (start, end) pairs
+        points: List of (point_value, quantity) pairs
+
+    Returns:
+        The number of intervals that get a point, processing intervals in
+        descending order and always taking the largest available point inside
+    """
+    # Distinct point values in ascending order with their total usable quantity
+    # (non-positive quantities are never used by the scan, so they add nothing)
+    quantity = {}
+    for value, q in points:
+        quantity[value] = quantity.get(value, 0) + max(q, 0)
+    values = sorted(quantity)
+    counts = [quantity[v] for v in values]
+
+    # parent[i + 1] leads to the nearest index <= i whose value still has quantity;
+    # slot 0 means "nothing left"
+    parent = list(range(len(values) + 1))
+    for i, c in enumerate(counts):
+        if c <= 0:
+            parent[i + 1] = i
+
+    def find(x):
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    res = 0
+    for interval_start, interval_end in sorted(intervals, reverse=True):
+        # Largest available value <= interval_end
+        x = find(bisect_right(values, interval_end))
+        if x and values[x - 1] >= interval_start:
+            res += 1
+            counts[x - 1] -= 1
+            if counts[x - 1] == 0:
+                parent[x] = x - 1
+    return res
+
 
 def main():
     # Read n and m from first line
@@ -29,28 +89,7 @@ def main():
         second = int(line[1])
         b.append((first, second))
 
-    # Sort both lists in descending order by first element
-    a.sort(reverse=True)
-    b.sort(reverse=True)
-
-    res = 0  # Count of successful matches
-
-    # For each interval, find the best matching point
-    for interval in a:
-        interval_start, interval_end = interval
-
-        # Check each point type
-        for j in range(m):
-            point_value, quantity = b[j]
-
-            # Check if point is within interval and has remaining quantity
-            if (quantity > 0 and
-                    point_value >= interval_start and
-                    point_value <= interval_end):
-                # Use one point of this type
-                res += 1
-                b[j] = (point_value, quantity - 1)
-                break
+    res = max_matches(a, b)  # Count of successful matches
 
     print(res)
 
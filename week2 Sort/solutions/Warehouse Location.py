@@ -7,8 +7,153 @@
 #    - For elements before median: (median * count) - sum_of_left_elements
 #    - For elements after median: sum_of_right_elements - (median * count)
 # 5. Output the total cost
+#
+# Online versions (for a stream of new store locations):
+# - OnlineMedianCost keeps the smaller half in a max-heap and the larger half in a
+#   min-heap together with the sum of each half; the lower median is the top of the
+#   max-heap, so the total distance median * |low| - sum(low) + sum(high) - median * |high|
+#   is available after every insertion, which costs O(log n)
+# - WeightedMedianCost handles per-location weights over a known set of candidate
+#   coordinates: two Fenwick trees over the compressed coordinates hold the weight and the
+#   weight * coordinate sums, the weighted median is found by descending the weight tree,
+#   and the cost follows from the prefix sums at the median, all in O(log n)
+# - "online" in main prints the optimal cost after each location of the input
 
+import heapq
 import sys
+from bisect import bisect_left
+
+
+class OnlineMedianCost:
+    def __init__(self):
+        """
+        Total distance to the median, maintained under insertions
+        """
+        self.low = []  # Max-heap (negated values) holding the smaller half, incl. the median
+        self.high = []  # Min-heap holding the larger half
+        self.low_sum = 0
+        self.high_sum = 0
+
+    def add(self, x):
+        """
+        Insert a new store location and return the new optimal total distance
+        """
+        if self.low and x > -self.low[0]:
+            heapq.heappush(self.high, x)
+            self.high_sum += x
+        else:
+            heapq.heappush(self.low, -x)
+            self.low_sum += x
+
+        # Rebalance so that len(low) == len(high) or len(high) + 1
+        if len(self.low) > len(self.high) + 1:
+            v = -heapq.heappop(self.low)
+            self.low_sum -= v
+            heapq.heappush(self.high, v)
+            self.high_sum += v
+        elif len(self.high) > len(self.low):
+            v = heapq.heappop(self.high)
+            self.high_sum -= v
+            heapq.heappush(self.low, -v)
+            self.low_sum += v
+        return self.cost()
+
+    def median(self):
+        """
+        Lower median, the same element a[(n + 1) // 2] main uses
+        """
+        return -self.low[0]
+
+    def cost(self):
+        """
+        Total distance from all locations to the median
+        """
+        if not self.low:
+            return 0
+        m = self.median()
+        return m * len(self.low) - self.low_sum + self.high_sum - m * len(self.high)
+
+
+class Fenwick:
+    def __init__(self, n):
+        """
+        Binary indexed tree over positions 1..n
+        """
+        self.n = n
+        self.tree = [0] * (n + 1)
+
+    def add(self, i, delta):
+        while i <= self.n:
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i):
+        s = 0
+        while i > 0:
+            s += self.tree[i]
+            i -= i & -i
+        return s
+
+
+class WeightedMedianCost:
+    def __init__(self, coordinates):
+        """
+        Weighted total distance to the weighted median, maintained under insertions
+
+        Args:
+            coordinates: every location that may be inserted (compressed once)
+        """
+        self.xs = sorted(set(coordinates))
+        self.weight = Fenwick(len(self.xs))  # Weight per coordinate
+        self.moment = Fenwick(len(self.xs))  # Weight * coordinate per coordinate
+        self.total_weight = 0
+        self.total_moment = 0
+        self.log = max(len(self.xs), 1).bit_length()
+
+    def add(self, x, w=1):
+        """
+        Insert location x with a non-negative weight w and return the new optimal cost
+        """
+        i = bisect_left(self.xs, x)
+        if i == len(self.xs) or self.xs[i] != x:
+            raise ValueError(f"{x} is not one of the declared coordinates")
+        self.weight.add(i + 1, w)
+        self.moment.add(i + 1, w * x)
+        self.total_weight += w
+        self.total_moment += w * x
+        return self.cost()
+
+    def median_index(self):
+        """
+        Position (1-based) of the smallest coordinate whose prefix weight reaches half
+        """
+        # Fenwick descent: largest position with 2 * prefix weight < total weight
+        pos = 0
+        acc = 0
+        for b in range(self.log, -1, -1):
+            nxt = pos + (1 << b)
+            if nxt <= self.weight.n and 2 * (acc + self.weight.tree[nxt]) < self.total_weight:
+                pos = nxt
+                acc += self.weight.tree[nxt]
+        return pos + 1
+
+    def median(self):
+        """
+        Weighted median; equals the lower median when all weights are 1
+        """
+        return self.xs[self.median_index() - 1]
+
+    def cost(self):
+        """
+        Sum of w * |x - median| over all inserted locations
+        """
+        if self.total_weight == 0:
+            return 0
+        i = self.median_index()
+        m = self.xs[i - 1]
+        w_le = self.weight.prefix(i)
+        s_le = self.moment.prefix(i)
+        return (m * w_le - s_le) + (self.total_moment - s_le) - m * (self.total_weight - w_le)
 
 
 def main():
@@ -38,4 +183,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if sys.argv[1:2] == ["online"]:
+        # Same input, but print the optimal cost after every new location
+        sys.stdin.readline()
+        tracker = OnlineMedianCost()
+        print("\n".join(str(tracker.add(x)) for x in map(int, sys.stdin.readline().split())))
+    else:
+        main()
\ No newline at end of file
@@ -2,6 +2,20 @@
 # It uses DFS (Depth-First Search) with backtracking to generate permutations
 # The algorithm builds permutations by selecting the largest available numbers first
 # This ensures the output is in reverse lexicographical order
+#
+# main uses the iterative engine below instead of dfs: next-permutation steps over indices
+# mapped through the labels n..1 give the same descending order without recursion, cached
+# prefix strings mean a step only re-renders the tail after the pivot, output is written in
+# large byte chunks, and an optional worker count splits the work by first element.
+# It is the descending-only form of the engine in week1 "Generate all permutations.py";
+# the solution folders hold standalone scripts, so it is kept here rather than imported.
+
+import sys
+from itertools import permutations
+
+# Number of lines collected before a chunk is encoded and handed to the writer
+CHUNK_LINES = 1 << 16
+
 
 def dfs(u, n, st, ans):
     """
@@ -26,13 +40,108 @@ def dfs(u, n, st, ans):
             st[i] = False  # Backtrack: unmark for other permutations
 
 
+def iter_chunks(n, prefix=(), chunk_lines=CHUNK_LINES):
+    """
+    Generate permutations of 1..n in reverse lexicographic order as encoded output chunks
+
+    Args:
+        n: Number of elements
+        prefix: Fixed leading indices (0-based ranks); only permutations starting
+                with this prefix are emitted
+        chunk_lines: Approximate number of lines per yielded chunk
+
+    Yields:
+        bytes objects holding newline-terminated lines
+    """
+    if n == 0:
+        # The only permutation of nothing is the empty one
+        yield b"\n"
+        return
+
+    # Index v stands for the number n - v, so ascending index order is descending output
+    labels = [str(v) for v in range(n, 0, -1)]
+    depth = len(prefix)
+    used = set(prefix)
+    p = list(prefix) + [v for v in range(n) if v not in used]
+    last = n - 1
+
+    # prefixes[k] is the rendered text of p[:k]
+    prefixes = [''] * n
+    for k in range(1, n):
+        prefixes[k] = prefixes[k - 1] + labels[p[k - 1]] + ' '
+
+    lines = []
+    while True:
+        lines.append(prefixes[last] + labels[p[last]])
+
+        # Find the pivot: the rightmost position smaller than its successor
+        i = n - 2
+        while i >= 0 and p[i] > p[i + 1]:
+            i -= 1
+        # Stop once the step would touch the fixed prefix (or there is no next permutation)
+        if i < depth:
+            break
+
+        # Swap the pivot with the rightmost larger element, then reverse the tail
+        j = last
+        while p[j] < p[i]:
+            j -= 1
+        p[i], p[j] = p[j], p[i]
+        lo, hi = i + 1, last
+        while lo < hi:
+            p[lo], p[hi] = p[hi], p[lo]
+            lo += 1
+            hi -= 1
+
+        # Re-render only the positions after the pivot
+        for k in range(i + 1, n):
+            prefixes[k] = prefixes[k - 1] + labels[p[k - 1]] + ' '
+
+        if len(lines) >= chunk_lines:
+            lines.append('')
+            yield '\n'.join(lines).encode()
+            lines = []
+
+    lines.append('')
+    yield '\n'.join(lines).encode()
+
+
+def _shard(args):
+    """Worker task: render every permutation under one prefix into a single bytes block."""
+    n, prefix = args
+    return b''.join(iter_chunks(n, prefix))
+
+
+def write_permutations(n, out, workers=1, depth=1):
+    """
+    Write all permutations of 1..n to a binary stream in reverse lexicographic order
+
+    Args:
+        n: Number of elements
+        out: Binary writable stream (e.g. sys.stdout.buffer)
+        workers: Number of processes; 1 generates everything in this process
+        depth: Length of the prefix handed to each worker in parallel mode
+    """
+    if workers <= 1 or n <= depth:
+        for chunk in iter_chunks(n):
+            out.write(chunk)
+        return
+
+    from multiprocessing import Pool
+
+    # permutations() of a sorted range yields the prefixes in lexicographic order
+    tasks = [(n, prefix) for prefix in permutations(range(n), depth)]
+    with Pool(workers) as pool:
+        for block in pool.imap(_shard, tasks):
+            out.write(block)
+
+
 def main():
     n = int(input().strip())
-    # Use n+1 for 1-indexed arrays to avoid index issues
-    st = [False] * (n + 1)  # State array to track used numbers (1-indexed)
-    ans = [0] * n  # Array to store current permutation (size n)
-    dfs(0, n, st, ans)
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    write_permutations(n, sys.stdout.buffer, workers=workers)
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()